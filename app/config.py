@@ -60,6 +60,11 @@ class Settings(BaseSettings):
     # -------------------------------------------------------------------------
     faiss_index_path: str = "./data/faiss_index"
     
+    # -------------------------------------------------------------------------
+    # Dataset Loading
+    # -------------------------------------------------------------------------
+    dataset_cache_dir: str = "./data/cache"  # Pickled document lists
+    
     # -------------------------------------------------------------------------
     # Application Settings
     # -------------------------------------------------------------------------
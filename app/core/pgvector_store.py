@@ -178,7 +178,7 @@ class PgVectorStore:
                 )
                 documents.append(doc)
             
-            logger.debug(f"Found {len(documents)} similar documents")
+            logger.debug("Found %d similar documents", len(documents))
             return documents
             
         except Exception as e:
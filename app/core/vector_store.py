@@ -137,9 +137,10 @@ class VectorStoreManager:
         
         # Use FAISS
         if self._faiss_store:
-            logger.debug(f"Searching FAISS for: {query[:100]}...")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Searching FAISS for: %s...", query[:100])
             results = self._faiss_store.similarity_search(query, k=k)
-            logger.debug(f"Found {len(results)} results")
+            logger.debug("Found %d results", len(results))
             return results
         
         logger.error("No vector store available for search")
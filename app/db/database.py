@@ -4,7 +4,7 @@ PostgreSQL database connection and session management using SQLAlchemy.
 Provides both sync and async database capabilities.
 """
 
-from sqlalchemy import create_engine, event
+from sqlalchemy import create_engine, event, inspect, text
 from sqlalchemy.orm import sessionmaker, declarative_base, Session
 from sqlalchemy.pool import QueuePool
 from typing import Generator
@@ -109,9 +109,42 @@ def init_db() -> None:
     
     logger.info("Initializing database tables...")
     Base.metadata.create_all(bind=engine)
+    _upgrade_schema()
     logger.info("Database tables created successfully")
 
 
+def _upgrade_schema() -> None:
+    """
+    Add columns introduced after a table was first created.
+    
+    Viva Explanation:
+    - create_all() only creates missing tables; it never alters existing ones
+    - document_embeddings.content_hash (with its unique index) was added
+      later, so older deployments get it here
+    - Checked via the inspector first, so startup takes no table lock
+      once the column exists
+    """
+    if engine.dialect.name != "postgresql":
+        return
+    
+    inspector = inspect(engine)
+    if not inspector.has_table("document_embeddings"):
+        return
+    columns = {column["name"] for column in inspector.get_columns("document_embeddings")}
+    if "content_hash" in columns:
+        return
+    
+    logger.info("Adding content_hash column to document_embeddings...")
+    with engine.begin() as conn:
+        conn.execute(text(
+            "ALTER TABLE document_embeddings ADD COLUMN IF NOT EXISTS content_hash bytea"
+        ))
+        conn.execute(text(
+            "CREATE UNIQUE INDEX IF NOT EXISTS ix_document_embeddings_content_hash "
+            "ON document_embeddings (content_hash)"
+        ))
+
+
 def check_db_connection() -> bool:
     """
     Check if database connection is healthy.
@@ -119,7 +152,6 @@ def check_db_connection() -> bool:
     Returns:
         bool: True if connection is successful, False otherwise
     """
-    from sqlalchemy import text
     try:
         with engine.connect() as conn:
             conn.execute(text("SELECT 1"))
@@ -10,7 +10,7 @@ from typing import Optional, List
 
 from sqlalchemy import (
     Column, String, Text, Boolean, Integer, DateTime, Float,
-    ForeignKey, Index, Enum as SQLEnum
+    ForeignKey, Index, LargeBinary, Enum as SQLEnum
 )
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
@@ -390,6 +390,11 @@ class DocumentEmbedding(Base):
         nullable=False,
         comment="Original document text chunk"
     )
+    content_hash = Column(
+        LargeBinary(16),
+        nullable=True,
+        comment="BLAKE2b (16-byte) digest of content, for deduplication"
+    )
     # Vector column for embeddings (384 dimensions for all-MiniLM-L6-v2)
     # Using conditional column creation to handle missing pgvector
     embedding = Column(
@@ -433,10 +438,12 @@ class DocumentEmbedding(Base):
         comment="Embedding creation timestamp"
     )
     
-    # Index for HNSW vector search (if pgvector supports it)
+    # The HNSW index on embedding (ix_document_embeddings_embedding) is built
+    # by scripts/migrate_faiss_to_pg.py after the bulk load, not here
     __table_args__ = (
         Index("idx_embeddings_source", "source"),
         Index("idx_embeddings_act_type", "act_type"),
+        Index("ix_document_embeddings_content_hash", "content_hash", unique=True),
     )
     
     def __repr__(self) -> str:
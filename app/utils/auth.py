@@ -3,10 +3,15 @@
 JWT authentication and password hashing utilities.
 """
 
-from datetime import datetime, timedelta
+from datetime import timedelta
 from typing import Optional
 from uuid import UUID
+import hashlib
+import hmac
+import threading
+import time
 
+from cachetools import TTLCache
 from jose import jwt, JWTError
 import bcrypt
 import logging
@@ -15,6 +20,13 @@ from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Recent bcrypt verification results, keyed by an HMAC of the credentials
+# (the raw password is never stored). Repeated logins within the TTL skip
+# the expensive bcrypt rounds.
+_VERIFY_CACHE: TTLCache = TTLCache(maxsize=2048, ttl=60)
+_VERIFY_CACHE_LOCK = threading.Lock()
+_VERIFY_CACHE_KEY = settings.jwt_secret_key.encode('utf-8')
+
 # =============================================================================
 # Password Hashing
 # =============================================================================
@@ -51,10 +63,28 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         
     Returns:
         bool: True if password matches
+        
+    Viva Explanation:
+    - Results are cached for 60 seconds under an HMAC of password + hash
+    - First login still pays the full bcrypt cost; repeats are near-instant
     """
     password_bytes = plain_password.encode('utf-8')
     hashed_bytes = hashed_password.encode('utf-8')
-    return bcrypt.checkpw(password_bytes, hashed_bytes)
+    
+    cache_key = hmac.new(
+        _VERIFY_CACHE_KEY,
+        password_bytes + b"\x00" + hashed_bytes,
+        hashlib.sha256
+    ).digest()
+    with _VERIFY_CACHE_LOCK:
+        cached = _VERIFY_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+    
+    result = bcrypt.checkpw(password_bytes, hashed_bytes)
+    with _VERIFY_CACHE_LOCK:
+        _VERIFY_CACHE[cache_key] = result
+    return result
 
 
 # =============================================================================
@@ -79,17 +109,20 @@ def create_access_token(
     - Signed with secret key for verification
     - Self-contained: no database lookup needed for validation
     """
+    # JWT expects epoch seconds, so skip datetime objects entirely
+    now = int(time.time())
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = now + int(expires_delta.total_seconds())
     else:
-        expire = datetime.utcnow() + timedelta(
-            minutes=settings.access_token_expire_minutes
-        )
+        expire = now + settings.access_token_expire_minutes * 60
+    
+    # Subjects are usually already strings; only UUIDs need converting
+    sub = subject if type(subject) is str else str(subject)
     
     to_encode = {
-        "sub": str(subject),
+        "sub": sub,
         "exp": expire,
-        "iat": datetime.utcnow(),  # Issued at
+        "iat": now,  # Issued at
         "type": "access"
     }
     
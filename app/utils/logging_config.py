@@ -5,6 +5,8 @@ Provides structured logging with file and console handlers.
 """
 
 import logging
+import logging.handlers
+import os
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -12,6 +14,34 @@ from typing import Optional
 
 from app.config import settings
 
+# Skip collecting thread/process info on every record (not in our format)
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter that reuses the formatted timestamp within the same second.
+    
+    Viva Explanation:
+    - Our datefmt has one-second resolution
+    - Records logged in the same second share one strftime() result
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cached_time = (None, "")
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        second = int(record.created)
+        cached_second, cached_str = self._cached_time
+        if second == cached_second:
+            return cached_str
+        formatted = super().formatTime(record, datefmt)
+        self._cached_time = (second, formatted)
+        return formatted
+
 
 def setup_logging(
     log_level: Optional[str] = None,
@@ -29,8 +59,11 @@ def setup_logging(
         
     Viva Explanation:
     - Creates both console and file handlers
+    - File writes are buffered and flushed in batches (or on errors)
     - Uses structured format with timestamp, level, and module info
     - Log level can be configured via environment variables
+    - With several server workers, each writes its own file (pid suffix):
+      size-based rotation is only safe with a single writer per file
     """
     
     # Use settings if not explicitly provided
@@ -40,9 +73,11 @@ def setup_logging(
     logs_dir = Path("logs")
     logs_dir.mkdir(exist_ok=True)
     
-    # Default log file with date
+    # Default log file with date (one per worker process when run.py
+    # starts several, so no two processes rotate the same file)
     if log_file is None:
-        log_file = logs_dir / f"app_{datetime.now().strftime('%Y%m%d')}.log"
+        suffix = f"_{os.getpid()}" if int(os.getenv("WEB_CONCURRENCY", "1")) > 1 else ""
+        log_file = logs_dir / f"app_{datetime.now().strftime('%Y%m%d')}{suffix}.log"
     
     # Configure root logger
     root_logger = logging.getLogger()
@@ -52,7 +87,7 @@ def setup_logging(
     root_logger.handlers.clear()
     
     # Log format
-    log_format = logging.Formatter(
+    log_format = CachedTimeFormatter(
         fmt="%(asctime)s | %(levelname)-8s | %(name)s:%(lineno)d | %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S"
     )
@@ -63,11 +98,25 @@ def setup_logging(
     console_handler.setFormatter(log_format)
     root_logger.addHandler(console_handler)
     
-    # File handler
-    file_handler = logging.FileHandler(log_file, encoding="utf-8")
+    # File handler (rotating, opened lazily on first write)
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_file,
+        maxBytes=100_000_000,
+        backupCount=5,
+        encoding="utf-8",
+        delay=True
+    )
     file_handler.setLevel(logging.DEBUG)  # Log everything to file
     file_handler.setFormatter(log_format)
-    root_logger.addHandler(file_handler)
+    
+    # Buffer records in memory; flush every 1000 records or on ERROR
+    buffered_handler = logging.handlers.MemoryHandler(
+        capacity=1000,
+        flushLevel=logging.ERROR,
+        target=file_handler
+    )
+    buffered_handler.setLevel(logging.DEBUG)
+    root_logger.addHandler(buffered_handler)
     
     # Suppress noisy third-party loggers
     logging.getLogger("httpx").setLevel(logging.WARNING)
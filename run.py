@@ -9,19 +9,41 @@ Or with uvicorn directly:
     uvicorn app.main:app --reload --host 0.0.0.0 --port 8000
 """
 
+import os
+
 import uvicorn
 from app.config import settings
 
 
 def main():
     """Run the FastAPI application."""
+    if settings.is_development:
+        uvicorn.run(
+            "app.main:app",
+            host="0.0.0.0",
+            port=8000,
+            reload=True,
+            log_level=settings.log_level.lower(),
+            access_log=True
+        )
+        return
+    
+    # Production: one worker per CPU (override with WEB_CONCURRENCY),
+    # uvloop event loop and httptools parser from uvicorn[standard].
+    # The count is exported so each worker's logging setup can use its
+    # own log file
+    workers = int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1))
+    os.environ["WEB_CONCURRENCY"] = str(workers)
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=settings.is_development,
+        workers=workers,
+        loop="uvloop",
+        http="httptools",
+        reload=False,
         log_level=settings.log_level.lower(),
-        access_log=True
+        access_log=False
     )
 
 
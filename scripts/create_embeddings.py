@@ -6,14 +6,18 @@ This is a one-time setup script that generates embeddings and saves the index.
 Viva Explanation:
 - Loads documents from the dataset
 - Splits into chunks using RecursiveCharacterTextSplitter
+- Streams chunks to the index in batches to bound memory use
 - Generates embeddings using configured provider (OpenAI/Gemini)
 - Creates and saves FAISS index for similarity search
 """
 
 import sys
 import os
+import hashlib
+import shelve
 from pathlib import Path
-from typing import List
+from itertools import chain, islice
+from typing import Iterable, Iterator, List, Optional
 import logging
 import time
 
@@ -29,8 +33,8 @@ from langchain_text_splitters import RecursiveCharacterTextSplitter
 from langchain_core.documents import Document
 
 from app.config import settings
-from app.core.vector_store import VectorStoreManager
-from scripts.load_dataset import load_indian_law_dataset, create_sample_documents
+from app.core.embeddings import get_embedding_model
+from scripts.load_dataset import iter_indian_law_dataset, create_sample_documents
 
 logging.basicConfig(
     level=logging.INFO,
@@ -39,24 +43,24 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def chunk_documents(documents: List[Document]) -> List[Document]:
+def iter_chunks(documents: Iterable[Document]) -> Iterator[Document]:
     """
-    Split documents into smaller chunks for better retrieval.
+    Split documents into smaller chunks, yielding them one at a time.
     
     Args:
-        documents: List of full documents
+        documents: Iterable of full documents
         
-    Returns:
-        List[Document]: Chunked documents
+    Yields:
+        Document: Chunked documents with chunk_index metadata
         
     Viva Explanation:
     - RecursiveCharacterTextSplitter tries to split on natural boundaries
     - Separators: paragraphs > sentences > words
     - Chunk size 800 chars is optimal for legal text
     - 150 char overlap ensures context is preserved across chunks
+    - Generator keeps only one document's chunks in memory at a time
     """
-    logger.info(f"Chunking {len(documents)} documents...")
-    logger.info(f"Chunk size: {settings.chunk_size}, Overlap: {settings.chunk_overlap}")
+    logger.info("Chunk size: %d, Overlap: %d", settings.chunk_size, settings.chunk_overlap)
     
     # Create splitter with configured settings
     splitter = RecursiveCharacterTextSplitter(
@@ -66,31 +70,109 @@ def chunk_documents(documents: List[Document]) -> List[Document]:
         length_function=len
     )
     
-    # Split documents
-    chunks = splitter.split_documents(documents)
+    chunk_index = 0
+    document_count = 0
+    for document in documents:
+        document_count += 1
+        for chunk in splitter.split_documents([document]):
+            # Add chunk index to metadata
+            chunk.metadata["chunk_index"] = chunk_index
+            chunk_index += 1
+            yield chunk
+    
+    logger.info("Created %d chunks from %d documents", chunk_index, document_count)
+
+
+def chunk_documents(documents: List[Document]) -> List[Document]:
+    """
+    Split documents into smaller chunks for better retrieval.
+    
+    Args:
+        documents: List of full documents
+        
+    Returns:
+        List[Document]: Chunked documents
+    """
+    logger.info("Chunking %d documents...", len(documents))
+    return list(iter_chunks(documents))
+
+
+def _batched(iterable: Iterable, size: int) -> Iterator[list]:
+    """Yield successive lists of at most `size` items from an iterable."""
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _embed_with_cache(
+    texts: List[str],
+    embeddings,
+    cache: shelve.Shelf
+) -> List[List[float]]:
+    """
+    Embed texts, reusing vectors cached on disk by previous runs.
+    
+    Args:
+        texts: Chunk texts to embed
+        embeddings: LangChain embedding model
+        cache: Open shelve cache of previously computed vectors
+        
+    Returns:
+        List[List[float]]: Embeddings in the same order as texts
+        
+    Viva Explanation:
+    - Cache key is sha1 of the chunk text, prefixed by the model identity
+      (class name + model name), so switching models never reuses vectors
+    - Only cache misses are sent to the embedding model, in one batch
+    - Re-indexing after small dataset edits skips almost all embedding work
+    """
+    model_name = getattr(embeddings, "model_name", None) or getattr(embeddings, "model", "")
+    prefix = f"{type(embeddings).__name__}:{model_name}:"
+    keys = [prefix + hashlib.sha1(text.encode("utf-8")).hexdigest() for text in texts]
+    vectors: List[Optional[List[float]]] = [None] * len(texts)
     
-    logger.info(f"Created {len(chunks)} chunks from {len(documents)} documents")
+    missing = []
+    for i, key in enumerate(keys):
+        vector = cache.get(key)
+        if vector is None:
+            missing.append(i)
+        else:
+            vectors[i] = vector
     
-    # Add chunk index to metadata
-    for i, chunk in enumerate(chunks):
-        chunk.metadata["chunk_index"] = i
+    logger.info(
+        "Embedding cache: %d hits, %d misses",
+        len(texts) - len(missing), len(missing)
+    )
     
-    return chunks
+    if missing:
+        new_vectors = embeddings.embed_documents([texts[i] for i in missing])
+        for i, vector in zip(missing, new_vectors):
+            vectors[i] = vector
+            cache[keys[i]] = vector
+    
+    return vectors
 
 
 def create_faiss_index(
-    documents: List[Document],
-    index_path: str = None
-) -> None:
+    documents: Iterable[Document],
+    index_path: str = None,
+    batch_size: int = 10_000
+) -> int:
     """
     Create and save FAISS index from documents.
     
     Args:
-        documents: Documents to index
+        documents: Documents (or a chunk generator) to index
         index_path: Path to save index (optional)
+        batch_size: Number of chunks embedded and added per batch
+        
+    Returns:
+        int: Number of chunks indexed
         
     Viva Explanation:
-    - Embeddings are generated for each chunk
+    - Embeddings are generated for each chunk (cached across runs)
+    - Chunks are embedded and added to the index in batches,
+      so peak memory is bounded by batch size rather than corpus size
     - FAISS IndexFlatL2 uses exact L2 distance
     - Index is saved to disk for fast loading
     """
@@ -99,9 +181,8 @@ def create_faiss_index(
     logger.info("=" * 60)
     logger.info("Creating FAISS Index")
     logger.info("=" * 60)
-    logger.info(f"Documents to index: {len(documents)}")
-    logger.info(f"Index path: {index_path}")
-    logger.info(f"Embedding provider: {settings.embedding_provider}")
+    logger.info("Index path: %s", index_path)
+    logger.info("Embedding provider: %s", settings.embedding_provider)
     
     # Validate API key for embeddings (HuggingFace doesn't need one!)
     if settings.embedding_provider == "openai" and not settings.openai_api_key:
@@ -111,25 +192,54 @@ def create_faiss_index(
     if settings.embedding_provider == "huggingface":
         logger.info("Using HuggingFace embeddings (FREE, no API key needed!)")
     
+    from langchain_community.vectorstores import FAISS
+    
     start_time = time.time()
     
-    # Create vector store manager
-    manager = VectorStoreManager(index_path)
+    embedding_model = get_embedding_model()
+    cache_dir = Path(index_path).parent
+    cache_dir.mkdir(parents=True, exist_ok=True)
     
     # Create index from documents
     logger.info("Generating embeddings and creating FAISS index...")
     logger.info("This may take several minutes depending on dataset size...")
     
-    manager.create_from_documents(documents, save=True)
+    faiss_store = None
+    with shelve.open(str(cache_dir / "embedding_cache")) as cache:
+        for batch in _batched(documents, batch_size):
+            texts = [doc.page_content for doc in batch]
+            metadatas = [doc.metadata for doc in batch]
+            vectors = _embed_with_cache(texts, embedding_model, cache)
+            
+            if faiss_store is None:
+                faiss_store = FAISS.from_embeddings(
+                    text_embeddings=list(zip(texts, vectors)),
+                    embedding=embedding_model,
+                    metadatas=metadatas
+                )
+            else:
+                faiss_store.add_embeddings(
+                    text_embeddings=list(zip(texts, vectors)),
+                    metadatas=metadatas
+                )
+            logger.info("Indexed %d chunks so far", faiss_store.index.ntotal)
+    
+    if faiss_store is None:
+        raise ValueError("No documents to index")
+    
+    faiss_store.save_local(index_path)
     
     duration = time.time() - start_time
+    total = faiss_store.index.ntotal
     
     logger.info("=" * 60)
     logger.info("Index Creation Complete!")
     logger.info("=" * 60)
-    logger.info(f"Total documents indexed: {manager.get_document_count()}")
-    logger.info(f"Time taken: {duration:.2f} seconds")
-    logger.info(f"Index saved to: {index_path}")
+    logger.info("Total documents indexed: %d", total)
+    logger.info("Time taken: %.2f seconds", duration)
+    logger.info("Index saved to: %s", index_path)
+    
+    return total
 
 
 def main():
@@ -138,38 +248,34 @@ def main():
     print("Indian Law RAG Chatbot - FAISS Index Creation")
     print("=" * 60 + "\n")
     
-    # Step 1: Load dataset
+    # Step 1: Load dataset (streamed; pull the first document so loading
+    # errors surface here rather than midway through indexing)
     print("Step 1: Loading dataset...")
     try:
-        documents = load_indian_law_dataset()
+        documents = iter_indian_law_dataset()
+        documents = chain([next(documents)], documents)
+    except StopIteration:
+        logger.error("No documents to index!")
+        return
     except Exception as e:
-        logger.warning(f"Dataset loading failed: {e}")
+        logger.warning("Dataset loading failed: %s", e)
         print("\nUsing sample documents for demonstration...")
         documents = create_sample_documents()
     
-    if not documents:
-        logger.error("No documents to index!")
-        return
-    
-    print(f"Loaded {len(documents)} documents\n")
-    
-    # Step 2: Chunk documents
-    print("Step 2: Chunking documents...")
-    chunks = chunk_documents(documents)
-    print(f"Created {len(chunks)} chunks\n")
+    print("Dataset ready, streaming documents\n")
     
-    # Step 3: Create FAISS index
-    print("Step 3: Creating FAISS index...")
+    # Step 2 + 3: Chunk documents and create FAISS index (streamed in batches)
+    print("Step 2: Chunking documents and creating FAISS index...")
     print("This will generate embeddings for all chunks.")
     print("Please wait...\n")
     
     try:
-        create_faiss_index(chunks)
-        print("\n✓ FAISS index created successfully!")
+        total_chunks = create_faiss_index(iter_chunks(documents))
+        print(f"\n✓ FAISS index created successfully with {total_chunks} chunks!")
         print(f"✓ Index saved to: {settings.faiss_index_path}")
         print("\nYou can now start the application with: python run.py")
     except Exception as e:
-        logger.error(f"Failed to create index: {e}")
+        logger.error("Failed to create index: %s", e)
         print(f"\n✗ Error: {e}")
         print("\nMake sure you have set your API key in the .env file:")
         print("  - GOOGLE_API_KEY for Gemini")
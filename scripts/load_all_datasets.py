@@ -4,236 +4,476 @@ Load multiple Indian law datasets for comprehensive coverage.
 Includes IPC sections, Constitution, and legal Q&A datasets.
 """
 
+import hashlib
+import json
+import multiprocessing
+import os
+import pickle
+import queue
 import re
 import sys
+import threading
+from collections import Counter, deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import List
+from typing import Iterable, Iterator, List, Optional, Tuple
 import logging
 
+import xxhash
 from datasets import load_dataset
 from langchain_core.documents import Document
 
+# google-re2 (optional) gives linear-time matching for the reference scans
+# on ASCII text (its \s and case folding differ from re's beyond ASCII)
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+# pyahocorasick (optional) matches all literal act phrases in one pass
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from app.config import settings
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Static core IPC / Constitution data
+DATA_DIR = Path(__file__).parent.parent / "data"
+CORE_IPC_FILE = "core_ipc.json"
+CONSTITUTION_FILE = "constitution.json"
+
+# Rows per column batch read from a dataset (one worker task per batch)
+ROW_BATCH_SIZE = 1024
+# Worker processes for row cleaning, and batches allowed in flight per loader
+MAX_WORKERS = os.cpu_count() or 1
+MAX_IN_FLIGHT = MAX_WORKERS * 2
+# Documents buffered ahead per background loader
+PREFETCH_SIZE = 10_000
+# Seconds a blocked prefetch thread waits between checks for a stop
+PREFETCH_POLL = 0.5
+# Log loader progress every this many documents
+PROGRESS_EVERY = 10_000
+
+
+# Precompiled patterns (compiled once, reused for every row)
+_WS_RE = re.compile(r'\s+')
+# Case-insensitivity is inline ((?i)) so the same patterns compile with re2
+_SEC_ART_RE = re.compile(r"(?i)(Section|Article)\s+(\d+[A-Z]?)")
+_SECTION_RE = re.compile(r"(?i)Section\s+(\d+[A-Z]?)")
+# Literal phrases that identify each act (matched case-insensitively)
+_ACT_PHRASES = {
+    "ipc": ("Indian Penal Code", "IPC"),
+    "crpc": ("Code of Criminal Procedure", "CrPC"),
+    "const": ("Constitution of India",),
+    "contract": ("Indian Contract Act",),
+    "evidence": ("Indian Evidence Act",),
+    "consumer": ("Consumer Protection Act",),
+    "mv": ("Motor Vehicles Act",),
+    "it": ("Information Technology Act", "IT Act"),
+}
+_ACT_NAMES = {
+    "ipc": "Indian Penal Code",
+    "crpc": "CrPC",
+    "const": "Constitution of India",
+    "contract": "Indian Contract Act",
+    "evidence": "Indian Evidence Act",
+    "consumer": "Consumer Protection Act",
+    "mv": "Motor Vehicles Act",
+    "it": "IT Act",
+}
+# Acts are checked in _ACT_PHRASES order: the earliest act named anywhere
+# in the text wins, wherever it appears
+_ACT_PRIORITY = {key: priority for priority, key in enumerate(_ACT_PHRASES)}
+_ACT_KEYS = tuple(_ACT_PHRASES)
+# All act phrases in one alternation so each text is scanned once;
+# the named group that matched identifies the act
+_ACT_UNION = re.compile(
+    "(?i)" + "|".join(
+        f"(?P<{key}>{'|'.join(re.escape(phrase) for phrase in phrases)})"
+        for key, phrases in _ACT_PHRASES.items()
+    )
+)
+
+
+def _compile_ascii(pattern: re.Pattern):
+    r"""
+    Compile an re pattern with re2 for use on ASCII text, or None without re2.
+    
+    re2's \s lacks \v and \x1c-\x1f, which re's matches, so it is spelled out.
+    """
+    if re2 is None:
+        return None
+    return re2.compile(pattern.pattern.replace(r"\s", r"[\t\n\x0b\x0c\r\x1c-\x1f ]"))
+
 
+# re2 versions of the scans, used for ASCII text when available
+_SEC_ART_RE2 = _compile_ascii(_SEC_ART_RE)
+_SECTION_RE2 = _compile_ascii(_SECTION_RE)
+_ACT_UNION_RE2 = _compile_ascii(_ACT_UNION)
+# Aho-Corasick automaton over the lowercased phrases, used when available
+_ACT_AUTOMATON = None
+if ahocorasick is not None:
+    _ACT_AUTOMATON = ahocorasick.Automaton()
+    for key, phrases in _ACT_PHRASES.items():
+        for phrase in phrases:
+            _ACT_AUTOMATON.add_word(phrase.lower(), _ACT_PRIORITY[key])
+    _ACT_AUTOMATON.make_automaton()
+
+
+@lru_cache(maxsize=50000)
 def clean_text(text: str) -> str:
     """Clean and normalize text."""
     if not text:
         return ""
-    text = re.sub(r'\s+', ' ', text)
-    return text.strip()
+    return _WS_RE.sub(' ', text).strip()
 
 
-def extract_legal_references(text: str) -> dict:
-    """Extract act and section info from text."""
-    metadata = {"act_name": "Indian Law", "section": None, "title": None}
+@lru_cache(maxsize=50000)
+def _find_act_name(text: str) -> str:
+    """Return the highest-priority act mentioned in text; cached since phrasing repeats a lot."""
+    # The accelerators only see ASCII text, where their case folding
+    # (lower() / re2) is exactly re's IGNORECASE
+    is_ascii = text.isascii()
+    if _ACT_AUTOMATON is not None and is_ascii:
+        # iter() reports every (overlapping) phrase occurrence
+        best = min((priority for _, priority in _ACT_AUTOMATON.iter(text.lower())), default=None)
+        return _ACT_NAMES[_ACT_KEYS[best]] if best is not None else "Indian Law"
     
-    act_patterns = [
-        (r"(Indian Penal Code|IPC)", "Indian Penal Code"),
-        (r"(Code of Criminal Procedure|CrPC)", "CrPC"),
-        (r"(Constitution of India)", "Constitution of India"),
-        (r"(Indian Contract Act)", "Indian Contract Act"),
-        (r"(Indian Evidence Act)", "Indian Evidence Act"),
-        (r"(Consumer Protection Act)", "Consumer Protection Act"),
-        (r"(Motor Vehicles Act)", "Motor Vehicles Act"),
-        (r"(Information Technology Act|IT Act)", "IT Act"),
-    ]
+    # Each search resumes one character past the previous match's start,
+    # so a phrase overlapping an earlier match (e.g. "Indian Penal Code"
+    # in "Constitution of Indian Penal Code") is still seen
+    act_union = _ACT_UNION_RE2 if _ACT_UNION_RE2 is not None and is_ascii else _ACT_UNION
+    best = None
+    act_match = act_union.search(text)
+    while act_match:
+        priority = _ACT_PRIORITY[act_match.lastgroup]
+        if best is None or priority < best:
+            best = priority
+            if best == 0:
+                break
+        act_match = act_union.search(text, act_match.start() + 1)
+    return _ACT_NAMES[_ACT_KEYS[best]] if best is not None else "Indian Law"
+
+
+@lru_cache(maxsize=50000)
+def _find_section(text: str) -> Optional[str]:
+    """Return the Section (preferred) or Article referenced in text."""
+    # One scan finds the first Section/Article; sections take priority,
+    # so after an Article hit the text from that Article on is checked
+    # (from its start: the Article's letter suffix may begin a "Section")
+    if _SEC_ART_RE2 is not None and text.isascii():
+        sec_art_re, section_re = _SEC_ART_RE2, _SECTION_RE2
+    else:
+        sec_art_re, section_re = _SEC_ART_RE, _SECTION_RE
     
-    for pattern, act_name in act_patterns:
-        if re.search(pattern, text, re.IGNORECASE):
-            metadata["act_name"] = act_name
-            break
+    ref_match = sec_art_re.search(text)
+    if not ref_match:
+        return None
+    if ref_match.group(1).lower() == "article":
+        section_match = section_re.search(text, ref_match.start())
+        if section_match:
+            return f"Section {section_match.group(1)}"
+    return f"{ref_match.group(1).title()} {ref_match.group(2)}"
+
+
+def extract_legal_references(text: str, skip_act: bool = False) -> dict:
+    """
+    Extract act and section info from text.
     
-    section_match = re.search(r"Section\s+(\d+[A-Z]?)", text, re.IGNORECASE)
-    article_match = re.search(r"Article\s+(\d+[A-Z]?)", text, re.IGNORECASE)
+    Pass skip_act=True when the caller already knows the act; the act scan
+    is skipped and act_name is left as None for the caller to fill in.
+    """
+    return {
+        "act_name": None if skip_act else _find_act_name(text),
+        "section": _find_section(text),
+        "title": None
+    }
+
+
+def _process_viber1_batch(batch: dict, indices: List[int]) -> dict:
+    """Turn a batch of viber1 rows into document columns ("" content = skipped)."""
+    _clean = clean_text
+    # Batch size is known up front, so preallocate the output columns
+    size = len(indices)
+    contents, act_names, sections = [""] * size, [None] * size, [None] * size
+    for i, (instruction, response) in enumerate(zip(batch["Instruction"], batch["Response"])):
+        # Cleaning only shrinks text, so short raw responses can be dropped
+        # before paying for the regex substitution
+        response = response or ""
+        if len(response) >= 50:
+            response = _clean(response)
+        
+        if len(response) < 50:
+            continue
+        
+        instruction = _clean(instruction or "")
+        metadata = extract_legal_references(response)
+        contents[i] = "".join(("Question: ", instruction, "\n\nAnswer: ", response))
+        act_names[i] = metadata["act_name"]
+        sections[i] = metadata["section"]
     
-    if section_match:
-        metadata["section"] = f"Section {section_match.group(1)}"
-    elif article_match:
-        metadata["section"] = f"Article {article_match.group(1)}"
+    return {"content": contents, "act_name": act_names, "section": sections, "index": indices}
+
+
+def _process_ipc_batch(batch: dict, indices: List[int]) -> dict:
+    """Turn a batch of IPC rows into document columns ("" content = skipped)."""
+    # Try different column names
+    fields = [field for field in ("text", "content", "section_text", "description") if field in batch]
+    _clean = clean_text
+    # Batch size is known up front, so preallocate the output columns
+    size = len(indices)
+    contents, sections = [""] * size, [None] * size
+    for i in range(size):
+        content = ""
+        for field in fields:
+            value = batch[field][i]
+            if value:
+                # Skip cleaning values already too short to keep
+                content = str(value)
+                if len(content) >= 30:
+                    content = _clean(content)
+                break
+        
+        if not content or len(content) < 30:
+            continue
+        
+        metadata = extract_legal_references(content, skip_act=True)
+        contents[i] = content
+        sections[i] = metadata["section"]
     
-    return metadata
+    return {
+        "content": contents,
+        "act_name": ["Indian Penal Code"] * size,
+        "section": sections,
+        "index": indices
+    }
 
 
-def load_viber1_dataset() -> List[Document]:
-    """Load viber1/indian-law-dataset (Q&A format)."""
-    logger.info("Loading viber1/indian-law-dataset...")
-    documents = []
+def _process_finetuning_batch(batch: dict, indices: List[int]) -> dict:
+    """Turn a batch of finetuning rows into document columns ("" content = skipped)."""
+    _clean = clean_text
+    size = len(indices)
+    empty = [""] * size
+    # This dataset has Q&A pairs; fall back per row to input/output, then text
+    columns = zip(
+        batch.get("question", empty), batch.get("input", empty),
+        batch.get("answer", empty), batch.get("output", empty),
+        batch.get("text", empty)
+    )
     
-    try:
-        dataset = load_dataset("viber1/indian-law-dataset")
-        data = dataset["train"]
+    # Batch size is known up front, so preallocate the output columns
+    contents, act_names, sections = [""] * size, [None] * size, [None] * size
+    for i, (question, input_text, answer, output_text, text) in enumerate(columns):
+        question = question or input_text or ""
+        answer = answer or output_text or ""
+        # Skip cleaning rows already too short to keep ("Question: " and
+        # "\n\nAnswer: " add 20 characters)
+        if question and answer:
+            if len(question) + len(answer) + 20 < 50:
+                content = ""
+            else:
+                content = "".join(("Question: ", _clean(question), "\n\nAnswer: ", _clean(answer)))
+        else:
+            content = text or ""
+            if len(content) >= 50:
+                content = _clean(content)
         
-        for idx, row in enumerate(data):
-            response = clean_text(row.get("Response", "") or "")
-            instruction = clean_text(row.get("Instruction", "") or "")
-            
-            if len(response) < 50:
+        if len(content) < 50:
+            continue
+        
+        metadata = extract_legal_references(content)
+        contents[i] = content
+        act_names[i] = metadata["act_name"]
+        sections[i] = metadata["section"]
+    
+    return {"content": contents, "act_name": act_names, "section": sections, "index": indices}
+
+
+def _row_pool() -> ProcessPoolExecutor:
+    """
+    Create the worker pool for the batch processors.
+    
+    Workers are spawned, not forked: the loaders run on prefetch threads,
+    and forking while other threads hold locks can deadlock the child.
+    """
+    return ProcessPoolExecutor(
+        max_workers=MAX_WORKERS,
+        mp_context=multiprocessing.get_context("spawn")
+    )
+
+
+def _iter_documents(
+    data,
+    process_batch,
+    source: str,
+    executor: Optional[Executor] = None
+) -> Iterator[Document]:
+    """
+    Run a batch processor over a (streaming) dataset and yield Documents.
+    
+    Column batches are cleaned and tagged in worker processes. Batches are
+    submitted as the stream is read and collected in order, with a bounded
+    number in flight so memory stays flat; rows the processor skipped come
+    back with empty content and are dropped. Pass executor to share one
+    pool between loaders; otherwise a pool is created for this dataset.
+    """
+    if executor is None:
+        with _row_pool() as executor:
+            yield from _iter_documents(data, process_batch, source, executor)
+        return
+    
+    pending = deque()
+    processed = 0
+    count = 0
+    # Checked once so the per-row path stays a plain bool test
+    is_debug = logger.isEnabledFor(logging.DEBUG)
+    
+    def collect(future) -> Iterator[Document]:
+        nonlocal count
+        columns = future.result()
+        for content, act_name, section, index in zip(
+            columns["content"], columns["act_name"], columns["section"], columns["index"]
+        ):
+            if not content:
+                if is_debug:
+                    logger.debug("%s: skipped row %d (too short)", source, index)
                 continue
+            yield Document(
+                page_content=content,
+                metadata={
+                    "act_name": act_name,
+                    "section": section,
+                    "title": None,
+                    "source": source,
+                    "index": index
+                }
+            )
+            count += 1
+            if count % PROGRESS_EVERY == 0:
+                logger.info(f"{source}: {count} documents so far...")
+    
+    try:
+        for batch in data.iter(batch_size=ROW_BATCH_SIZE):
+            size = len(next(iter(batch.values()), ()))
+            pending.append(executor.submit(
+                process_batch, batch, list(range(processed, processed + size))
+            ))
+            processed += size
             
-            content = f"Question: {instruction}\n\nAnswer: {response}"
-            metadata = extract_legal_references(response)
-            metadata["source"] = "viber1/indian-law-dataset"
-            metadata["index"] = idx
-            
-            documents.append(Document(page_content=content, metadata=metadata))
+            if len(pending) >= MAX_IN_FLIGHT:
+                yield from collect(pending.popleft())
         
-        logger.info(f"Loaded {len(documents)} from viber1/indian-law-dataset")
+        while pending:
+            yield from collect(pending.popleft())
+    finally:
+        # Closed early or failed: don't leave queued batches for the workers
+        for future in pending:
+            future.cancel()
+
+
+def load_viber1_dataset(
+    failed: Optional[List[str]] = None,
+    executor: Optional[Executor] = None
+) -> Iterator[Document]:
+    """Load viber1/indian-law-dataset (Q&A format)."""
+    logger.info("Loading viber1/indian-law-dataset...")
+    count = 0
+    
+    try:
+        # Stream rows instead of materializing the whole dataset
+        data = load_dataset("viber1/indian-law-dataset", split="train", streaming=True)
+        for count, doc in enumerate(
+            _iter_documents(data, _process_viber1_batch, "viber1/indian-law-dataset", executor), 1
+        ):
+            yield doc
+        logger.info(f"Loaded {count} from viber1/indian-law-dataset")
     except Exception as e:
         logger.warning(f"Failed to load viber1 dataset: {e}")
-    
-    return documents
+        if failed is not None:
+            failed.append("viber1/indian-law-dataset")
 
 
-def load_ipc_dataset() -> List[Document]:
+def load_ipc_dataset(
+    failed: Optional[List[str]] = None,
+    executor: Optional[Executor] = None
+) -> Iterator[Document]:
     """Load harshitv804/Indian_Penal_Code dataset."""
     logger.info("Loading harshitv804/Indian_Penal_Code...")
-    documents = []
+    count = 0
     
     try:
-        dataset = load_dataset("harshitv804/Indian_Penal_Code")
-        data = dataset["train"] if "train" in dataset else list(dataset.values())[0]
-        
-        for idx, row in enumerate(data):
-            # Try different column names
-            content = ""
-            for field in ["text", "content", "section_text", "description"]:
-                if field in row and row[field]:
-                    content = clean_text(str(row[field]))
-                    break
-            
-            if not content or len(content) < 30:
-                continue
-            
-            metadata = extract_legal_references(content)
-            metadata["act_name"] = "Indian Penal Code"
-            metadata["source"] = "harshitv804/Indian_Penal_Code"
-            metadata["index"] = idx
-            
-            documents.append(Document(page_content=content, metadata=metadata))
-        
-        logger.info(f"Loaded {len(documents)} from IPC dataset")
+        dataset = load_dataset("harshitv804/Indian_Penal_Code", streaming=True)
+        data = dataset["train"] if "train" in dataset else next(iter(dataset.values()))
+        for count, doc in enumerate(
+            _iter_documents(data, _process_ipc_batch, "harshitv804/Indian_Penal_Code", executor), 1
+        ):
+            yield doc
+        logger.info(f"Loaded {count} from IPC dataset")
     except Exception as e:
         logger.warning(f"Failed to load IPC dataset: {e}")
-    
-    return documents
+        if failed is not None:
+            failed.append("harshitv804/Indian_Penal_Code")
 
 
-def load_legal_finetuning_dataset() -> List[Document]:
+def load_legal_finetuning_dataset(
+    failed: Optional[List[str]] = None,
+    executor: Optional[Executor] = None
+) -> Iterator[Document]:
     """Load Techmaestro369/indian-legal-texts-finetuning."""
     logger.info("Loading Techmaestro369/indian-legal-texts-finetuning...")
-    documents = []
+    count = 0
     
     try:
-        dataset = load_dataset("Techmaestro369/indian-legal-texts-finetuning")
-        data = dataset["train"] if "train" in dataset else list(dataset.values())[0]
-        
-        for idx, row in enumerate(data):
-            # This dataset has Q&A pairs
-            question = row.get("question", row.get("input", ""))
-            answer = row.get("answer", row.get("output", ""))
-            
-            if question and answer:
-                content = f"Question: {clean_text(question)}\n\nAnswer: {clean_text(answer)}"
-            else:
-                content = clean_text(str(row.get("text", "")))
-            
-            if len(content) < 50:
-                continue
-            
-            metadata = extract_legal_references(content)
-            metadata["source"] = "Techmaestro369/indian-legal-texts-finetuning"
-            metadata["index"] = idx
-            
-            documents.append(Document(page_content=content, metadata=metadata))
-        
-        logger.info(f"Loaded {len(documents)} from legal finetuning dataset")
+        dataset = load_dataset("Techmaestro369/indian-legal-texts-finetuning", streaming=True)
+        data = dataset["train"] if "train" in dataset else next(iter(dataset.values()))
+        for count, doc in enumerate(
+            _iter_documents(
+                data, _process_finetuning_batch, "Techmaestro369/indian-legal-texts-finetuning",
+                executor
+            ),
+            1
+        ):
+            yield doc
+        logger.info(f"Loaded {count} from legal finetuning dataset")
     except Exception as e:
         logger.warning(f"Failed to load finetuning dataset: {e}")
-    
-    return documents
+        if failed is not None:
+            failed.append("Techmaestro369/indian-legal-texts-finetuning")
 
 
-def get_ipc_core_sections() -> List[Document]:
-    """Add core IPC sections that are commonly asked about."""
-    logger.info("Adding core IPC sections...")
-    
-    ipc_sections = [
-        {
-            "section": "Section 302",
-            "title": "Punishment for murder",
-            "content": "Section 302 of the Indian Penal Code provides the punishment for murder. Whoever commits murder shall be punished with death, or imprisonment for life, and shall also be liable to fine. Murder is defined under Section 300 as culpable homicide with the intention of causing death or with the intention of causing such bodily injury as the offender knows to be likely to cause death, or with the intention of causing bodily injury sufficient in the ordinary course of nature to cause death."
-        },
-        {
-            "section": "Section 300",
-            "title": "Murder",
-            "content": "Section 300 of the Indian Penal Code defines Murder. Culpable homicide is murder if the act by which the death is caused is done with the intention of causing death, or if it is done with the intention of causing such bodily injury as the offender knows to be likely to cause the death of the person to whom the harm is caused, or if it is done with the intention of causing bodily injury to any person and the bodily injury intended to be inflicted is sufficient in the ordinary course of nature to cause death."
-        },
-        {
-            "section": "Section 376",
-            "title": "Punishment for rape",
-            "content": "Section 376 of the Indian Penal Code deals with the punishment for rape. Whoever commits rape shall be punished with rigorous imprisonment for a term which shall not be less than ten years, but which may extend to imprisonment for life, and shall also be liable to fine. The punishment may extend to imprisonment for life which shall mean imprisonment for the remainder of that person's natural life, in certain aggravated cases."
-        },
-        {
-            "section": "Section 307",
-            "title": "Attempt to murder",
-            "content": "Section 307 of the Indian Penal Code deals with attempt to murder. Whoever does any act with such intention or knowledge, and under such circumstances that, if he by that act caused death, he would be guilty of murder, shall be punished with imprisonment of either description for a term which may extend to ten years, and shall also be liable to fine; and if hurt is caused to any person by such act, the offender shall be liable either to imprisonment for life, or to such punishment as is hereinbefore mentioned."
-        },
-        {
-            "section": "Section 304B",
-            "title": "Dowry death",
-            "content": "Section 304B of the Indian Penal Code deals with dowry death. Where the death of a woman is caused by any burns or bodily injury or occurs otherwise than under normal circumstances within seven years of her marriage and it is shown that soon before her death she was subjected to cruelty or harassment by her husband or any relative of her husband for, or in connection with, any demand for dowry, such death shall be called dowry death, and such husband or relative shall be deemed to have caused her death."
-        },
-        {
-            "section": "Section 354",
-            "title": "Assault or criminal force to woman with intent to outrage her modesty",
-            "content": "Section 354 of the Indian Penal Code provides punishment for assault or criminal force to woman with intent to outrage her modesty. Whoever assaults or uses criminal force to any woman, intending to outrage or knowing it to be likely that he will thereby outrage her modesty, shall be punished with imprisonment of either description for a term which shall not be less than one year but which may extend to five years, and shall also be liable to fine."
-        },
-        {
-            "section": "Section 420",
-            "title": "Cheating and dishonestly inducing delivery of property",
-            "content": "Section 420 of the Indian Penal Code deals with cheating and dishonestly inducing delivery of property. Whoever cheats and thereby dishonestly induces the person deceived to deliver any property to any person, or to make, alter or destroy the whole or any part of a valuable security, or anything which is signed or sealed, and which is capable of being converted into a valuable security, shall be punished with imprisonment of either description for a term which may extend to seven years, and shall also be liable to fine."
-        },
-        {
-            "section": "Section 498A",
-            "title": "Husband or relative of husband subjecting woman to cruelty",
-            "content": "Section 498A of the Indian Penal Code deals with husband or relative of husband of a woman subjecting her to cruelty. Whoever, being the husband or the relative of the husband of a woman, subjects such woman to cruelty shall be punished with imprisonment for a term which may extend to three years and shall also be liable to fine. Cruelty means any wilful conduct which is of such a nature as is likely to drive the woman to commit suicide or to cause grave injury or danger to life, limb or health of the woman."
-        },
-        {
-            "section": "Section 379",
-            "title": "Punishment for theft",
-            "content": "Section 379 of the Indian Penal Code provides the punishment for theft. Whoever commits theft shall be punished with imprisonment of either description for a term which may extend to three years, or with fine, or with both. Theft is defined under Section 378 as the dishonest taking of any movable property out of the possession of any person without that person's consent."
-        },
-        {
-            "section": "Section 378",
-            "title": "Theft",
-            "content": "Section 378 of the Indian Penal Code defines Theft. Whoever, intending to take dishonestly any movable property out of the possession of any person without that person's consent, moves that property in order to such taking, is said to commit theft. The essential elements are: dishonest intention, movable property, possession of another person, absence of consent, and actual moving of the property."
-        },
-        {
-            "section": "Section 323",
-            "title": "Punishment for voluntarily causing hurt",
-            "content": "Section 323 of the Indian Penal Code provides punishment for voluntarily causing hurt. Whoever, except in the case provided for by section 334, voluntarily causes hurt, shall be punished with imprisonment of either description for a term which may extend to one year, or with fine which may extend to one thousand rupees, or with both."
-        },
-        {
-            "section": "Section 506",
-            "title": "Punishment for criminal intimidation",
-            "content": "Section 506 of the Indian Penal Code deals with punishment for criminal intimidation. Whoever commits the offence of criminal intimidation shall be punished with imprisonment of either description for a term which may extend to two years, or with fine, or with both. If threat be to cause death or grievous hurt, or to cause the destruction of any property by fire, or to cause an offence punishable with death or imprisonment for life, the punishment may extend to seven years."
-        }
-    ]
-    
-    documents = []
-    for idx, section_data in enumerate(ipc_sections):
-        content = f"""IPC {section_data['section']} - {section_data['title']}
+_CORE_IPC_TEMPLATE = """IPC {section} - {title}
+
+{content}
+
+Legal Reference: [Indian Penal Code, {section}]"""
+
+_CONSTITUTION_TEMPLATE = """Constitution of India - {article} - {title}
 
-{section_data['content']}
+{content}
 
-Legal Reference: [Indian Penal Code, {section_data['section']}]"""
+Legal Reference: [Constitution of India, {article}]"""
+
+
+def _load_json(filename: str) -> List[dict]:
+    """Load a static data file from the project's data directory."""
+    with open(DATA_DIR / filename, encoding="utf-8") as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=1)
+def _core_ipc_docs() -> Tuple[Document, ...]:
+    """Build core IPC section documents once from data/core_ipc.json."""
+    documents = []
+    for idx, section_data in enumerate(_load_json(CORE_IPC_FILE)):
+        content = _CORE_IPC_TEMPLATE.format_map(section_data)
         
         documents.append(Document(
             page_content=content,
@@ -245,55 +485,15 @@ Legal Reference: [Indian Penal Code, {section_data['section']}]"""
                 "index": idx
             }
         ))
-    
-    logger.info(f"Added {len(documents)} core IPC sections")
-    return documents
+    return tuple(documents)
 
 
-def get_constitution_articles() -> List[Document]:
-    """Add key Constitutional articles."""
-    logger.info("Adding Constitution articles...")
-    
-    articles = [
-        {
-            "article": "Article 14",
-            "title": "Equality before law",
-            "content": "Article 14 of the Constitution of India guarantees equality before law. The State shall not deny to any person equality before the law or the equal protection of the laws within the territory of India. This article embodies the principle that all persons are equal before the law and are entitled to equal protection of the law."
-        },
-        {
-            "article": "Article 19",
-            "title": "Protection of certain rights regarding freedom of speech, etc.",
-            "content": "Article 19 of the Constitution of India guarantees six fundamental freedoms to all citizens: (a) freedom of speech and expression; (b) freedom to assemble peaceably and without arms; (c) freedom to form associations or unions; (d) freedom to move freely throughout the territory of India; (e) freedom to reside and settle in any part of the territory of India; (f) freedom to practice any profession, or to carry on any occupation, trade or business."
-        },
-        {
-            "article": "Article 21",
-            "title": "Protection of life and personal liberty",
-            "content": "Article 21 of the Constitution of India provides that no person shall be deprived of his life or personal liberty except according to procedure established by law. This is one of the most fundamental rights. The Supreme Court has expanded its scope to include the right to live with dignity, right to livelihood, right to health, right to education, right to shelter, right to privacy, and many other rights."
-        },
-        {
-            "article": "Article 21A",
-            "title": "Right to education",
-            "content": "Article 21A of the Constitution of India provides that the State shall provide free and compulsory education to all children of the age of six to fourteen years in such manner as the State may, by law, determine. This article was inserted by the Constitution (Eighty-sixth Amendment) Act, 2002."
-        },
-        {
-            "article": "Article 32",
-            "title": "Remedies for enforcement of rights",
-            "content": "Article 32 of the Constitution of India provides the right to move the Supreme Court for the enforcement of fundamental rights. The Supreme Court shall have power to issue directions or orders or writs, including writs in the nature of habeas corpus, mandamus, prohibition, quo warranto and certiorari, for the enforcement of any of the rights conferred by Part III of the Constitution."
-        },
-        {
-            "article": "Article 226",
-            "title": "Power of High Courts to issue writs",
-            "content": "Article 226 of the Constitution of India gives the High Courts the power to issue writs including habeas corpus, mandamus, prohibition, quo warranto, and certiorari for the enforcement of fundamental rights and for any other purpose. This power is wider than Article 32 as it can be invoked for purposes other than enforcement of fundamental rights."
-        }
-    ]
-    
+@lru_cache(maxsize=1)
+def _constitution_docs() -> Tuple[Document, ...]:
+    """Build Constitution article documents once from data/constitution.json."""
     documents = []
-    for idx, article_data in enumerate(articles):
-        content = f"""Constitution of India - {article_data['article']} - {article_data['title']}
-
-{article_data['content']}
-
-Legal Reference: [Constitution of India, {article_data['article']}]"""
+    for idx, article_data in enumerate(_load_json(CONSTITUTION_FILE)):
+        content = _CONSTITUTION_TEMPLATE.format_map(article_data)
         
         documents.append(Document(
             page_content=content,
@@ -305,56 +505,204 @@ Legal Reference: [Constitution of India, {article_data['article']}]"""
                 "index": idx
             }
         ))
-    
+    return tuple(documents)
+
+
+def get_ipc_core_sections() -> List[Document]:
+    """Add core IPC sections that are commonly asked about."""
+    logger.info("Adding core IPC sections...")
+    # Deep copies: callers may mutate metadata without touching the cache
+    documents = [doc.model_copy(deep=True) for doc in _core_ipc_docs()]
+    logger.info(f"Added {len(documents)} core IPC sections")
+    return documents
+
+
+def get_constitution_articles() -> List[Document]:
+    """Add key Constitutional articles."""
+    logger.info("Adding Constitution articles...")
+    # Deep copies: callers may mutate metadata without touching the cache
+    documents = [doc.model_copy(deep=True) for doc in _constitution_docs()]
     logger.info(f"Added {len(documents)} Constitution articles")
     return documents
 
 
-def load_all_datasets() -> List[Document]:
-    """Load all available datasets and combine them."""
-    logger.info("=" * 60)
-    logger.info("Loading All Indian Law Datasets")
-    logger.info("=" * 60)
+HF_DATASETS = (
+    "viber1/indian-law-dataset",
+    "harshitv804/Indian_Penal_Code",
+    "Techmaestro369/indian-legal-texts-finetuning",
+)
+
+
+def _corpus_fingerprint() -> Optional[str]:
+    """
+    Fingerprint the corpus from the Hub dataset revisions, this script
+    and the static data files.
+    
+    Returns None if the revisions can't be fetched, which disables the cache.
+    """
+    try:
+        from huggingface_hub import HfApi
+        api = HfApi()
+        parts = [api.dataset_info(name).sha or "" for name in HF_DATASETS]
+    except Exception as e:
+        logger.warning(f"Could not fetch dataset revisions, skipping cache: {e}")
+        return None
     
-    all_documents = []
+    for path in (Path(__file__), DATA_DIR / CORE_IPC_FILE, DATA_DIR / CONSTITUTION_FILE):
+        parts.append(str(path.stat().st_mtime_ns))
+    return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()[:16]
+
+
+def _prefetch(
+    documents: Iterable[Document],
+    stop: threading.Event,
+    maxsize: int = PREFETCH_SIZE
+) -> Iterator[Document]:
+    """
+    Start pulling documents on a background thread, buffering up to maxsize.
     
-    # 1. Core IPC sections (most important - always include)
-    all_documents.extend(get_ipc_core_sections())
+    The thread starts immediately, so several network-bound loaders can be
+    fetching at once while the caller consumes them one after another.
+    Setting stop makes the thread exit (within PREFETCH_POLL seconds) even
+    if nothing consumes the buffer any more.
+    """
+    buffer: queue.Queue = queue.Queue(maxsize=maxsize)
+    done = object()
     
-    # 2. Constitution articles
-    all_documents.extend(get_constitution_articles())
+    def put(item) -> bool:
+        """Put item on the buffer; False if stopped while waiting for room."""
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=PREFETCH_POLL)
+                return True
+            except queue.Full:
+                continue
+        return False
     
-    # 3. viber1/indian-law-dataset
-    all_documents.extend(load_viber1_dataset())
+    def produce() -> None:
+        try:
+            for doc in documents:
+                if not put(doc):
+                    return
+        finally:
+            put(done)
     
-    # 4. Try to load additional datasets
-    try:
-        all_documents.extend(load_ipc_dataset())
-    except:
-        pass
+    threading.Thread(target=produce, daemon=True).start()
     
-    try:
-        all_documents.extend(load_legal_finetuning_dataset())
-    except:
-        pass
+    def consume() -> Iterator[Document]:
+        while (doc := buffer.get()) is not done:
+            yield doc
     
+    return consume()
+
+
+def _read_cached_documents(cache_path: Path) -> Iterator[Document]:
+    """Yield documents from a cache file written one pickle per document."""
+    with open(cache_path, "rb") as f:
+        while True:
+            try:
+                yield pickle.load(f)
+            except EOFError:
+                return
+
+
+def load_all_datasets() -> Iterator[Document]:
+    """
+    Load all available datasets and stream them as one sequence.
+    
+    Documents are yielded as they are produced, so only a bounded number
+    are in memory at once. They are also written through to the dataset
+    cache directory, keyed by a fingerprint of the dataset revisions and
+    this script, so later runs skip downloading and parsing entirely.
+    """
     logger.info("=" * 60)
-    logger.info(f"Total documents loaded: {len(all_documents)}")
+    logger.info("Loading All Indian Law Datasets")
     logger.info("=" * 60)
     
-    return all_documents
+    cache_path = None
+    fingerprint = _corpus_fingerprint()
+    if fingerprint:
+        cache_path = Path(settings.dataset_cache_dir) / f"docs_{fingerprint}.pkl"
+        if cache_path.exists():
+            logger.info(f"Loading cached documents from {cache_path}")
+            yield from _read_cached_documents(cache_path)
+            return
+    
+    cache_file = None
+    tmp_path = None
+    if cache_path:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(".tmp")
+        cache_file = open(tmp_path, "wb")
+    
+    # 1. Core IPC sections (most important - always include)
+    # 2. Constitution articles
+    # 3-5. Hugging Face datasets, fetched concurrently in the background
+    #      (network-bound); each loader logs its own errors and records
+    #      the dataset in failed, even when it stopped part-way through
+    hf_loaders = (load_viber1_dataset, load_ipc_dataset, load_legal_finetuning_dataset)
+    failed: List[str] = []
+    # Set when this generator finishes or is closed early, so the prefetch
+    # threads stop instead of blocking on a full buffer forever
+    stop = threading.Event()
+    # One worker pool shared by the concurrent loaders, so the cores are
+    # split between them instead of each loader starting a full pool
+    executor = _row_pool()
+    documents = chain(
+        get_ipc_core_sections(),
+        get_constitution_articles(),
+        *(_prefetch(loader(failed, executor), stop) for loader in hf_loaders)
+    )
+    
+    seen = set()
+    total = 0
+    duplicates = 0
+    cached = False
+    
+    try:
+        for doc in documents:
+            # Skip documents whose content has already been seen
+            digest = xxhash.xxh64_intdigest(doc.page_content.encode("utf-8"))
+            if digest in seen:
+                duplicates += 1
+                continue
+            seen.add(digest)
+            total += 1
+            
+            if cache_file:
+                pickle.dump(doc, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+            yield doc
+        
+        logger.info("=" * 60)
+        logger.info(f"Total documents loaded: {total} ({duplicates} duplicates skipped)")
+        logger.info("=" * 60)
+        
+        # Only cache a full corpus: a loader that failed part-way through
+        # (e.g. a dropped stream) would otherwise be cached as truncated
+        if cache_file and failed:
+            logger.warning(f"Not caching documents; incomplete datasets: {', '.join(failed)}")
+        elif cache_file:
+            cache_file.close()
+            tmp_path.replace(cache_path)
+            cached = True
+            logger.info(f"Cached documents to {cache_path}")
+    finally:
+        stop.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+        if cache_file:
+            cache_file.close()
+            if not cached:
+                tmp_path.unlink(missing_ok=True)
 
 
 if __name__ == "__main__":
-    docs = load_all_datasets()
-    print(f"\nTotal documents: {len(docs)}")
+    logging.basicConfig(level=logging.INFO)
+    
+    # Consume the stream once, counting documents by source
+    sources = Counter(doc.metadata.get("source", "unknown") for doc in load_all_datasets())
     
-    # Show breakdown by source
-    sources = {}
-    for doc in docs:
-        src = doc.metadata.get("source", "unknown")
-        sources[src] = sources.get(src, 0) + 1
+    print(f"\nTotal documents: {sum(sources.values())}")
     
     print("\nDocuments by source:")
-    for src, count in sorted(sources.items(), key=lambda x: -x[1]):
+    for src, count in sources.most_common():
         print(f"  {src}: {count}")
@@ -10,12 +10,17 @@ Viva Explanation:
 - Metadata includes act name, section, and title for proper referencing
 """
 
+import hashlib
+import os
 import re
 import sys
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 import logging
 
+from cachetools import LRUCache
 from datasets import load_dataset
 from langchain_core.documents import Document
 
@@ -24,9 +29,91 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from app.config import settings
 
+# Numba (optional) JIT-compiles a byte-level scanner for section/article refs
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Hyperscan (optional) matches all act names in one streaming pass
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns (compiled once, reused for every row)
+_WS_RE = re.compile(r'\s+')
+_SEC_ART_RE = re.compile(r"(Section|Article)\s+(\d+[A-Z]?)", re.IGNORECASE)
+_SECTION_RE = re.compile(r"Section\s+(\d+[A-Z]?)", re.IGNORECASE)
+
+# Common Indian law patterns, in priority order
+ACT_PATTERNS = [
+    "Indian Penal Code|IPC",
+    "Code of Criminal Procedure|CrPC",
+    "Code of Civil Procedure|CPC",
+    "Constitution of India",
+    "Indian Contract Act",
+    "Indian Evidence Act",
+    "Transfer of Property Act",
+    "Hindu Marriage Act",
+    "Muslim Personal Law",
+    "Companies Act",
+    "Income Tax Act",
+    "GST Act",
+    "Consumer Protection Act",
+    "Right to Information Act|RTI",
+    "Motor Vehicles Act",
+    "Negotiable Instruments Act",
+    "Arbitration and Conciliation Act",
+    "Information Technology Act|IT Act",
+]
+# One alternation with a group per act, so each text is scanned once;
+# match.lastindex - 1 is the matched act's priority
+_ACT_ALT_RE = re.compile("|".join(f"({pattern})" for pattern in ACT_PATTERNS), re.IGNORECASE)
+# Canonical spelling of each alternative, keyed by its lowercase form
+_ACT_CANONICAL = {
+    name.lower(): name
+    for pattern in ACT_PATTERNS
+    for name in pattern.split("|")
+}
+# Flat list of act name alternatives and the priority of each (Hyperscan ids)
+_ACT_NAMES = [name for pattern in ACT_PATTERNS for name in pattern.split("|")]
+_ACT_PRIORITY = [
+    priority
+    for priority, pattern in enumerate(ACT_PATTERNS)
+    for _ in pattern.split("|")
+]
+if hyperscan is not None:
+    _ACT_HS_DB = hyperscan.Database()
+    _ACT_HS_DB.compile(
+        expressions=[name.encode("ascii") for name in _ACT_NAMES],
+        ids=list(range(len(_ACT_NAMES))),
+        elements=len(_ACT_NAMES),
+        # Report match starts too, to pick an act's leftmost occurrence
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SOM_LEFTMOST] * len(_ACT_NAMES),
+    )
+else:
+    _ACT_HS_DB = None
+
+# Rows per column batch read from the dataset (one worker task per batch)
+ROW_BATCH_SIZE = 1024
+# Worker processes for row cleaning, and batches allowed in flight at once
+MAX_WORKERS = os.cpu_count() or 1
+MAX_IN_FLIGHT = MAX_WORKERS * 2
+
+# Extracted reference metadata, keyed by a hash of the response text
+# (per process; duplicate responses skip the scans). LRU-bounded so
+# memory stays flat however large the corpus is
+META_CACHE_SIZE = 50_000
+_meta_cache = LRUCache(maxsize=META_CACHE_SIZE)
+
+# Common OCR ligature fixes in legal documents
+_LIGATURE_TABLE = str.maketrans({'ﬁ': 'fi', 'ﬂ': 'fl', 'ﬀ': 'ff', 'ﬃ': 'ffi', 'ﬄ': 'ffl'})
+
 
 def clean_text(text: str) -> str:
     """
@@ -47,14 +134,13 @@ def clean_text(text: str) -> str:
         return ""
     
     # Normalize whitespace
-    text = re.sub(r'\s+', ' ', text)
+    text = _WS_RE.sub(' ', text)
     
     # Remove leading/trailing whitespace
     text = text.strip()
     
-    # Fix common OCR issues in legal documents
-    text = text.replace('ﬁ', 'fi')
-    text = text.replace('ﬂ', 'fl')
+    # Fix common OCR issues in legal documents (single pass)
+    text = text.translate(_LIGATURE_TABLE)
     
     return text
 
@@ -104,84 +190,293 @@ def extract_act_info(row: dict) -> dict:
     return metadata
 
 
-def load_indian_law_dataset() -> List[Document]:
+def _process_rows(
+    start_idx: int, instructions: List[str], responses: List[str]
+) -> Tuple[List[Document], int]:
     """
-    Load the viber1/indian-law-dataset and convert to LangChain Documents.
+    Turn one column batch of dataset rows into Documents.
+    
+    Runs in a worker process, so it is a top-level (picklable) function.
     
     Returns:
-        List[Document]: List of LangChain Document objects
+        Tuple of (documents, number of rows skipped as too short)
+    """
+    documents = []
+    skipped = 0
+    
+    for idx, (instruction, response) in enumerate(zip(instructions, responses), start_idx):
+        # Get the Response (contains the legal information)
+        response = response or ""
+        
+        # Skip short rows before any cleaning: cleaning never lengthens
+        # ASCII text (only ligature fixes can), so these would be dropped anyway
+        if len(response) < 50 and response.isascii():
+            skipped += 1
+            continue
+        
+        # Clean the text
+        response = clean_text(response)
+        
+        # Skip if too short
+        if len(response) < 50:
+            skipped += 1
+            continue
+        
+        instruction = clean_text(instruction or "")
+        
+        # Combine instruction and response for better context
+        # Format: "Q: [question] A: [answer with legal info]"
+        content = f"Question: {instruction}\n\nAnswer: {response}"
+        
+        # Try to extract act/section info from the response text
+        # (reusing the result for repeated responses)
+        key = hashlib.blake2b(response.encode(), digest_size=16).digest()
+        references = _meta_cache.get(key)
+        if references is None:
+            references = extract_legal_references(response)
+            _meta_cache[key] = references
+        metadata = dict(references)
+        metadata["index"] = idx
+        metadata["instruction"] = instruction[:200]  # Store first 200 chars of question
+        metadata["source"] = "viber1/indian-law-dataset"
+        
+        documents.append(Document(
+            page_content=content,
+            metadata=metadata
+        ))
+    
+    return documents, skipped
+
+
+def iter_indian_law_dataset() -> Iterator[Document]:
+    """
+    Stream the viber1/indian-law-dataset as LangChain Documents.
+    
+    Yields:
+        Document: LangChain Document objects, one per usable row
         
     Viva Explanation:
-    - Uses HuggingFace datasets library for efficient loading
+    - Uses HuggingFace datasets streaming mode: rows are fetched lazily
+    - Memory stays constant regardless of dataset size
     - Dataset format: Instruction (question) + Response (answer with legal info)
     - Creates Document objects with page_content and metadata
+    - Row cleaning runs in a process pool, one column batch per task
     """
     logger.info("Loading viber1/indian-law-dataset from Hugging Face...")
     
     try:
-        # Load the dataset
-        dataset = load_dataset("viber1/indian-law-dataset")
+        # Stream the dataset instead of downloading it up front
+        dataset = load_dataset("viber1/indian-law-dataset", streaming=True)
         
         # Get the train split (or first available split)
         if "train" in dataset:
             data = dataset["train"]
         else:
-            split_name = list(dataset.keys())[0]
+            split_name = next(iter(dataset.keys()))
             data = dataset[split_name]
             logger.info(f"Using split: {split_name}")
         
-        logger.info(f"Dataset loaded with {len(data)} entries")
         logger.info(f"Columns: {data.column_names}")
         
         # Convert to Documents
         # This dataset has 'Instruction' (question) and 'Response' (answer) columns
-        documents = []
+        created = 0
         skipped = 0
+        processed = 0
+        pending = deque()
         
-        for idx, row in enumerate(data):
-            # Get the Response (contains the legal information)
-            response = row.get("Response", "") or ""
-            instruction = row.get("Instruction", "") or ""
-            
-            # Clean the text
-            response = clean_text(response)
-            instruction = clean_text(instruction)
-            
-            # Skip if too short
-            if len(response) < 50:
-                skipped += 1
-                continue
-            
-            # Combine instruction and response for better context
-            # Format: "Q: [question] A: [answer with legal info]"
-            content = f"Question: {instruction}\n\nAnswer: {response}"
-            
-            # Try to extract act/section info from the response text
-            metadata = extract_legal_references(response)
-            metadata["index"] = idx
-            metadata["instruction"] = instruction[:200]  # Store first 200 chars of question
-            metadata["source"] = "viber1/indian-law-dataset"
-            
-            # Create Document
-            doc = Document(
-                page_content=content,
-                metadata=metadata
-            )
-            documents.append(doc)
+        # Column batches are cleaned in worker processes. Batches are
+        # submitted as the stream is read and collected in order, with a
+        # bounded number in flight so memory stays flat
+        with ProcessPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            for batch in data.iter(batch_size=ROW_BATCH_SIZE):
+                pending.append(executor.submit(
+                    _process_rows, processed, batch["Instruction"], batch["Response"]
+                ))
+                processed += len(batch["Response"])
+                
+                if len(pending) >= MAX_IN_FLIGHT:
+                    documents, batch_skipped = pending.popleft().result()
+                    skipped += batch_skipped
+                    created += len(documents)
+                    yield from documents
+                
+                # Progress logging
+                if processed // 5000 > (processed - len(batch["Response"])) // 5000:
+                    logger.info(f"Processed {processed} entries...")
             
-            # Progress logging
-            if (idx + 1) % 5000 == 0:
-                logger.info(f"Processed {idx + 1} / {len(data)} entries...")
-        
-        logger.info(f"Created {len(documents)} documents (skipped {skipped} short entries)")
+            while pending:
+                documents, batch_skipped = pending.popleft().result()
+                skipped += batch_skipped
+                created += len(documents)
+                yield from documents
         
-        return documents
+        logger.info(f"Created {created} documents (skipped {skipped} short entries)")
     
     except Exception as e:
         logger.error(f"Error loading dataset: {e}")
         raise
 
 
+def load_indian_law_dataset() -> List[Document]:
+    """
+    Load the viber1/indian-law-dataset and convert to LangChain Documents.
+    
+    Returns:
+        List[Document]: List of LangChain Document objects
+        
+    Viva Explanation:
+    - Materializes iter_indian_law_dataset() for callers that need a list
+    - Prefer the iterator when documents are processed one pass at a time
+    """
+    return list(iter_indian_law_dataset())
+
+
+_SECTION_KEY = tuple(b"section")
+_ARTICLE_KEY = tuple(b"article")
+
+
+def _match_keyword(buf, pos, keyword) -> bool:
+    """Case-insensitive match of a lowercase ASCII keyword at buf[pos]."""
+    if pos + len(keyword) > len(buf):
+        return False
+    for k in range(len(keyword)):
+        # OR-ing 0x20 lowercases ASCII letters
+        if buf[pos + k] | 0x20 != keyword[k]:
+            return False
+    return True
+
+
+def _scan_reference_bytes(buf, start, sections_only):
+    r"""
+    State machine for (Section|Article)\s+(\d+[A-Z]?) over ASCII bytes.
+    
+    Returns:
+        (kind, match_start, number_start, number_end); kind is 0 for
+        no match, 1 for Section and 2 for Article
+    """
+    n = len(buf)
+    for pos in range(start, n):
+        if _match_keyword(buf, pos, _SECTION_KEY):
+            kind = 1
+        elif not sections_only and _match_keyword(buf, pos, _ARTICLE_KEY):
+            kind = 2
+        else:
+            continue
+        
+        # Both keywords are 7 bytes; then at least one whitespace byte
+        i = pos + 7
+        while i < n and (buf[i] == 32 or 9 <= buf[i] <= 13 or 28 <= buf[i] <= 31):
+            i += 1
+        if i == pos + 7:
+            continue
+        
+        # At least one digit, then an optional letter suffix
+        number_start = i
+        while i < n and 48 <= buf[i] <= 57:
+            i += 1
+        if i == number_start:
+            continue
+        if i < n and 97 <= (buf[i] | 0x20) <= 122:
+            i += 1
+        return kind, pos, number_start, i
+    
+    return 0, 0, 0, 0
+
+
+if njit is not None:
+    _match_keyword = njit(cache=True)(_match_keyword)
+    _scan_reference = njit(cache=True)(_scan_reference_bytes)
+else:
+    _scan_reference = None
+
+
+def _find_reference(text: str) -> Optional[str]:
+    """
+    Find the section/article reference in text, preferring sections.
+    
+    Viva Explanation:
+    - Plain ASCII text goes through the Numba-compiled byte scanner
+      (byte offsets equal character offsets, and the regex classes
+      reduce to the same ASCII ranges)
+    - Anything else, or a missing Numba, uses the precompiled regexes
+    - Sections take priority, so after an Article hit the text from
+      that Article's start on is checked for a Section (the Article's
+      letter suffix may begin one)
+    """
+    if _scan_reference is not None and text.isascii():
+        buf = np.frombuffer(text.encode("ascii"), dtype=np.uint8)
+        kind, match_start, start, end = _scan_reference(buf, 0, False)
+        if kind == 2:
+            section_kind, _, section_start, section_end = _scan_reference(buf, match_start, True)
+            if section_kind:
+                return f"Section {text[section_start:section_end]}"
+            return f"Article {text[start:end]}"
+        if kind == 1:
+            return f"Section {text[start:end]}"
+        return None
+    
+    ref_match = _SEC_ART_RE.search(text)
+    if not ref_match:
+        return None
+    if ref_match.group(1).lower() == "article":
+        # From the Article's start: its letter suffix may begin a "Section"
+        section_match = _SECTION_RE.search(text, ref_match.start())
+        if section_match:
+            return f"Section {section_match.group(1)}"
+    return f"{ref_match.group(1).title()} {ref_match.group(2)}"
+
+
+def _find_act_name(text: str) -> Optional[str]:
+    """
+    Find the highest-priority act named in text.
+    
+    Viva Explanation:
+    - Plain ASCII text is scanned by Hyperscan when it is installed:
+      every act name is matched in one pass over the bytes
+    - Hyperscan reports every hit, overlapping ones included, so the
+      best act is simply the lowest priority among them
+    - Otherwise a single regex alternation scan keeps the best act found,
+      resuming one character past each match so overlapping names
+      (e.g. "IPC" in "RTIPC") are not skipped
+    - Returns the act's canonical spelling, or None if none is named
+    """
+    if _ACT_HS_DB is not None and text.isascii():
+        hits = []
+        
+        def on_match(expr_id, start, end, flags, context):
+            hits.append((_ACT_PRIORITY[expr_id], start, expr_id))
+        
+        _ACT_HS_DB.scan(text.encode("ascii"), match_event_handler=on_match)
+        
+        # Best act first, then its leftmost occurrence, then the first
+        # alternative in pattern order (= expression id), as re.search would
+        if not hits:
+            return None
+        return _ACT_NAMES[min(hits)[2]]
+    
+    best_match = None
+    match = _ACT_ALT_RE.search(text)
+    while match:
+        if best_match is None or match.lastindex < best_match.lastindex:
+            best_match = match
+            if match.lastindex == 1:
+                break
+        match = _ACT_ALT_RE.search(text, match.start() + 1)
+    if best_match:
+        matched = best_match.group(0)
+        canonical = _ACT_CANONICAL.get(matched.lower())
+        if canonical is None:
+            # Non-ASCII case-folded spellings (e.g. "ſ" for "s") aren't keys:
+            # take the matched act's first alternative that matches the text
+            canonical = next(
+                name for name in ACT_PATTERNS[best_match.lastindex - 1].split("|")
+                if re.fullmatch(re.escape(name), matched, re.IGNORECASE)
+            )
+        return canonical
+    return None
+
+
 def extract_legal_references(text: str) -> dict:
     """
     Extract legal act names and section numbers from text.
@@ -198,43 +493,13 @@ def extract_legal_references(text: str) -> dict:
         "title": None
     }
     
-    # Common Indian law patterns
-    act_patterns = [
-        r"(Indian Penal Code|IPC)",
-        r"(Code of Criminal Procedure|CrPC)",
-        r"(Code of Civil Procedure|CPC)",
-        r"(Constitution of India)",
-        r"(Indian Contract Act)",
-        r"(Indian Evidence Act)",
-        r"(Transfer of Property Act)",
-        r"(Hindu Marriage Act)",
-        r"(Muslim Personal Law)",
-        r"(Companies Act)",
-        r"(Income Tax Act)",
-        r"(GST Act)",
-        r"(Consumer Protection Act)",
-        r"(Right to Information Act|RTI)",
-        r"(Motor Vehicles Act)",
-        r"(Negotiable Instruments Act)",
-        r"(Arbitration and Conciliation Act)",
-        r"(Information Technology Act|IT Act)",
-    ]
-    
     # Find act name
-    for pattern in act_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            metadata["act_name"] = match.group(1)
-            break
-    
-    # Find section/article numbers
-    section_match = re.search(r"Section\s+(\d+[A-Z]?)", text, re.IGNORECASE)
-    article_match = re.search(r"Article\s+(\d+[A-Z]?)", text, re.IGNORECASE)
+    act_name = _find_act_name(text)
+    if act_name:
+        metadata["act_name"] = act_name
     
-    if section_match:
-        metadata["section"] = f"Section {section_match.group(1)}"
-    elif article_match:
-        metadata["section"] = f"Article {article_match.group(1)}"
+    # Find section/article number
+    metadata["section"] = _find_reference(text)
     
     return metadata
 
@@ -359,13 +624,10 @@ def main():
             print(f"  Metadata: {documents[0].metadata}")
         
         # Count by act
-        act_counts = {}
-        for doc in documents:
-            act = doc.metadata.get("act_name", "Unknown")
-            act_counts[act] = act_counts.get(act, 0) + 1
+        act_counts = Counter(doc.metadata.get("act_name", "Unknown") for doc in documents)
         
         print("\nDocuments by Act:")
-        for act, count in sorted(act_counts.items(), key=lambda x: -x[1])[:10]:
+        for act, count in act_counts.most_common(10):
             print(f"  {act}: {count}")
         
     except Exception as e:
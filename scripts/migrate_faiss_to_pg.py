@@ -7,6 +7,7 @@ This script:
 2. Creates the document_embeddings table
 3. Reads existing FAISS index
 4. Transfers all embeddings to PostgreSQL
+5. Builds the HNSW vector index over the loaded embeddings
 
 Run once: python scripts/migrate_faiss_to_pg.py
 """
@@ -16,9 +17,13 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from pathlib import Path
+import hashlib
 import logging
+import queue
+import threading
 
 from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import insert
 
 from app.config import settings
 from app.db.database import engine, SessionLocal, init_db
@@ -28,6 +33,13 @@ from app.core.embeddings import get_embedding_model
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Row batches built ahead of the DB writer during migration
+PREFETCH_BATCHES = 4
+# End-of-batches marker on the migration queue
+_SENTINEL = object()
+# ANN index on the embedding column, built once after the bulk load
+VECTOR_INDEX_NAME = "ix_document_embeddings_embedding"
+
 
 def enable_pgvector():
     """Enable pgvector extension in PostgreSQL."""
@@ -45,6 +57,25 @@ def enable_pgvector():
             return False
 
 
+def create_vector_index():
+    """Build the HNSW index on embeddings (after the bulk load)."""
+    logger.info("Creating HNSW vector index...")
+    
+    with engine.connect() as conn:
+        try:
+            conn.execute(text(
+                f"CREATE INDEX IF NOT EXISTS {VECTOR_INDEX_NAME} ON document_embeddings "
+                "USING hnsw (embedding vector_cosine_ops) WITH (m = 16, ef_construction = 64)"
+            ))
+            conn.commit()
+            logger.info("✓ HNSW vector index created")
+            return True
+        except Exception as e:
+            logger.error(f"✗ Failed to create HNSW index: {e}")
+            logger.error("HNSW needs pgvector 0.5.0+; searches still work without it")
+            return False
+
+
 def create_tables():
     """Create all database tables including document_embeddings."""
     logger.info("Creating database tables...")
@@ -76,6 +107,69 @@ def load_faiss_index():
     return faiss_store
 
 
+def _produce_batches(docstore, index_to_docstore_id, all_vectors, batch_size, batches, producer_errors):
+    """
+    Build insert() parameter batches and put them on the queue.
+    
+    Runs in a background thread. Each item is (rows, errors, duplicates);
+    _SENTINEL marks the end, and is sent even if building a batch fails.
+    Documents whose content was already seen in this run are skipped.
+    """
+    ntotal = len(all_vectors)
+    seen = set()
+    try:
+        # Walk FAISS index positions in ranges, looking each document up
+        # by id, instead of materialising every docstore item up front
+        for start in range(0, ntotal, batch_size):
+            rows = []
+            errors = 0
+            duplicates = 0
+            
+            for index_pos in range(start, min(start + batch_size, ntotal)):
+                doc_id = index_to_docstore_id.get(index_pos)
+                try:
+                    doc = docstore.get(doc_id)
+                    
+                    if doc is None:
+                        logger.warning(f"Could not find document for index position {index_pos}")
+                        continue
+                    
+                    # Skip repeated content (common in legal Q&A corpora)
+                    content_hash = hashlib.blake2b(
+                        doc.page_content.encode(), digest_size=16
+                    ).digest()
+                    if content_hash in seen:
+                        duplicates += 1
+                        continue
+                    seen.add(content_hash)
+                    
+                    # Get embedding vector (pgvector accepts NumPy arrays directly)
+                    embedding_vector = all_vectors[index_pos]
+                    
+                    metadata = doc.metadata or {}
+                    
+                    rows.append({
+                        "content": doc.page_content,
+                        "content_hash": content_hash,
+                        "embedding": embedding_vector,
+                        "source": metadata.get("source", "unknown"),
+                        "section": metadata.get("section"),
+                        "title": metadata.get("title"),
+                        "act_type": metadata.get("act_type"),
+                        "extra_data": metadata
+                    })
+                    
+                except Exception as e:
+                    logger.error(f"Error migrating doc {doc_id}: {e}")
+                    errors += 1
+            
+            batches.put((rows, errors, duplicates))
+    except Exception as e:
+        producer_errors.append(e)
+    finally:
+        batches.put(_SENTINEL)
+
+
 def migrate_embeddings(faiss_store, batch_size=100):
     """Transfer embeddings from FAISS to PostgreSQL."""
     
@@ -83,12 +177,17 @@ def migrate_embeddings(faiss_store, batch_size=100):
     docstore = faiss_store.docstore._dict
     index_to_docstore_id = faiss_store.index_to_docstore_id
     
-    total_docs = len(docstore)
+    total_docs = faiss_store.index.ntotal
     logger.info(f"Migrating {total_docs} documents to PostgreSQL...")
     
+    # Reconstruct all vectors in one call: contiguous (ntotal, dim) float32 array
+    all_vectors = faiss_store.index.reconstruct_n(0, faiss_store.index.ntotal)
+    
     db = SessionLocal()
     migrated = 0
     errors = 0
+    duplicates = 0
+    index_dropped = False
     
     try:
         # Clear existing embeddings (optional - comment out if you want to append)
@@ -101,54 +200,52 @@ def migrate_embeddings(faiss_store, batch_size=100):
                 db.commit()
                 logger.info("✓ Cleared existing embeddings")
         
-        # Get embeddings from FAISS index
-        embeddings = get_embedding_model()
+        # Drop the ANN index so inserts don't maintain it row by row;
+        # it is rebuilt from the loaded data once the load ends
+        db.execute(text(f"DROP INDEX IF EXISTS {VECTOR_INDEX_NAME}"))
+        db.commit()
+        index_dropped = True
         
-        # Process documents
-        doc_items = list(docstore.items())
+        # Process documents: a background thread builds row batches while
+        # this thread writes them, so FAISS reads overlap DB commits
+        batches = queue.Queue(maxsize=PREFETCH_BATCHES)
+        producer_errors = []
+        producer = threading.Thread(
+            target=_produce_batches,
+            args=(docstore, index_to_docstore_id, all_vectors, batch_size, batches, producer_errors),
+            daemon=True,
+        )
+        producer.start()
         
-        for i in range(0, len(doc_items), batch_size):
-            batch = doc_items[i:i + batch_size]
-            
-            for doc_id, doc in batch:
-                try:
-                    # Get the embedding for this document
-                    # We need to look up the index position
-                    index_pos = None
-                    for idx, stored_id in index_to_docstore_id.items():
-                        if stored_id == doc_id:
-                            index_pos = idx
-                            break
-                    
-                    if index_pos is None:
-                        logger.warning(f"Could not find index position for doc {doc_id}")
-                        continue
-                    
-                    # Get embedding vector from FAISS index
-                    embedding_vector = faiss_store.index.reconstruct(index_pos).tolist()
-                    
-                    metadata = doc.metadata or {}
-                    
-                    doc_embedding = DocumentEmbedding(
-                        content=doc.page_content,
-                        embedding=embedding_vector,
-                        source=metadata.get("source", "unknown"),
-                        section=metadata.get("section"),
-                        title=metadata.get("title"),
-                        act_type=metadata.get("act_type"),
-                        extra_data=metadata
-                    )
-                    db.add(doc_embedding)
-                    migrated += 1
-                    
-                except Exception as e:
-                    logger.error(f"Error migrating doc {doc_id}: {e}")
-                    errors += 1
+        while (item := batches.get()) is not _SENTINEL:
+            rows, batch_errors, batch_duplicates = item
+            errors += batch_errors
+            duplicates += batch_duplicates
             
+            # One multi-row INSERT per batch (no ORM unit-of-work overhead);
+            # content already in the table from an earlier run is left as is.
+            # Only inserted rows come back from RETURNING (rowcount counts
+            # every parameter set for a batched executemany)
+            if rows:
+                table = DocumentEmbedding.__table__
+                result = db.execute(
+                    insert(table)
+                    .on_conflict_do_nothing(index_elements=["content_hash"])
+                    .returning(table.c.id),
+                    rows,
+                )
+                migrated += len(result.all())
             db.commit()
             logger.info(f"Progress: {migrated}/{total_docs} ({migrated*100//total_docs}%)")
         
-        logger.info(f"✓ Migration complete: {migrated} documents migrated, {errors} errors")
+        producer.join()
+        if producer_errors:
+            raise producer_errors[0]
+        
+        logger.info(
+            f"✓ Migration complete: {migrated} documents migrated, "
+            f"{duplicates} duplicates skipped, {errors} errors"
+        )
         
     except Exception as e:
         db.rollback()
@@ -156,6 +253,10 @@ def migrate_embeddings(faiss_store, batch_size=100):
         raise
     finally:
         db.close()
+        # Rebuild even after a failed batch: committed rows (and any that
+        # were already there) must not be left without the index
+        if index_dropped:
+            create_vector_index()
     
     return migrated
 
@@ -202,7 +303,7 @@ def main():
         print("\n⚠️  No FAISS index to migrate. Create embeddings first.")
         return
     
-    # Step 4: Migrate
+    # Step 4: Migrate (rebuilds the vector index over the loaded data)
     migrate_embeddings(faiss_store)
     
     # Step 5: Verify
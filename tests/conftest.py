@@ -0,0 +1,17 @@
+# Indian Law RAG Chatbot - Test Configuration
+"""
+Shared pytest configuration.
+
+test_api.py is a manual script against a running server
+(python tests/test_api.py), so pytest doesn't collect it.
+"""
+
+import sys
+from pathlib import Path
+
+collect_ignore = ["test_api.py"]
+
+# Make the project root and the standalone scripts importable
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "scripts"))
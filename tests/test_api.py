@@ -14,31 +14,31 @@ import asyncio
 BASE_URL = "http://localhost:8000"
 
 
-def test_health():
+async def test_health(client: httpx.AsyncClient):
     """Test health endpoint."""
+    response = await client.get("/health")
+    
     print("\n" + "=" * 60)
     print("TEST: Health Check")
     print("=" * 60)
-    
-    response = httpx.get(f"{BASE_URL}/health")
     print(f"Status: {response.status_code}")
     print(f"Response: {json.dumps(response.json(), indent=2)}")
     
     return response.status_code == 200
 
 
-def test_chat(query: str):
+async def test_chat(client: httpx.AsyncClient, query: str):
     """Test chat endpoint."""
+    response = await client.post(
+        "/api/v1/chat",
+        json={"query": query}
+    )
+    
+    # Print after the await so concurrent tests don't interleave output
     print("\n" + "=" * 60)
     print(f"TEST: Chat Query")
     print("=" * 60)
     print(f"Query: {query}")
-    
-    response = httpx.post(
-        f"{BASE_URL}/api/v1/chat",
-        json={"query": query}
-    )
-    
     print(f"\nStatus: {response.status_code}")
     
     if response.status_code == 200:
@@ -55,18 +55,17 @@ def test_chat(query: str):
     return response.status_code == 200
 
 
-def test_retrieval(query: str):
+async def test_retrieval(client: httpx.AsyncClient, query: str):
     """Test retrieval-only endpoint."""
+    response = await client.post(
+        "/api/v1/retrieve",
+        json={"query": query, "top_k": 5}
+    )
+    
     print("\n" + "=" * 60)
     print(f"TEST: Retrieval Only")
     print("=" * 60)
     print(f"Query: {query}")
-    
-    response = httpx.post(
-        f"{BASE_URL}/api/v1/retrieve",
-        json={"query": query, "top_k": 5}
-    )
-    
     print(f"\nStatus: {response.status_code}")
     
     if response.status_code == 200:
@@ -81,7 +80,7 @@ def test_retrieval(query: str):
     return response.status_code == 200
 
 
-def main():
+async def main():
     """Run all tests."""
     print("\n" + "=" * 60)
     print("🏛️ Indian Law RAG Chatbot - Test Suite")
@@ -101,29 +100,31 @@ def main():
         "How to file a patent in Europe?",
     ]
     
-    results = []
+    # All tests run concurrently over one keep-alive client, so wall time
+    # is roughly the slowest request rather than the sum of all of them
+    names = ["Health Check"]
+    tests = []
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=30) as client:
+        # Test 1: Health check
+        tests.append(test_health(client))
+        
+        # Test 2: Chat queries
+        for query in test_queries[:3]:  # Test first 3
+            names.append(f"Chat: {query[:30]}...")
+            tests.append(test_chat(client, query))
+        
+        # Test 3: Retrieval
+        names.append("Retrieval")
+        tests.append(test_retrieval(client, "punishment for theft"))
+        
+        outcomes = await asyncio.gather(*tests, return_exceptions=True)
     
-    # Test 1: Health check
-    try:
-        results.append(("Health Check", test_health()))
-    except Exception as e:
-        print(f"Error: {e}")
-        results.append(("Health Check", False))
-    
-    # Test 2: Chat queries
-    for query in test_queries[:3]:  # Test first 3
-        try:
-            results.append((f"Chat: {query[:30]}...", test_chat(query)))
-        except Exception as e:
-            print(f"Error: {e}")
-            results.append((f"Chat: {query[:30]}...", False))
-    
-    # Test 3: Retrieval
-    try:
-        results.append(("Retrieval", test_retrieval("punishment for theft")))
-    except Exception as e:
-        print(f"Error: {e}")
-        results.append(("Retrieval", False))
+    results = []
+    for name, outcome in zip(names, outcomes):
+        if isinstance(outcome, Exception):
+            print(f"Error: {outcome}")
+            outcome = False
+        results.append((name, outcome))
     
     # Summary
     print("\n" + "=" * 60)
@@ -152,5 +153,5 @@ if __name__ == "__main__":
         print("Then run this test script in another terminal.")
         sys.exit(1)
     
-    success = main()
+    success = asyncio.run(main())
     sys.exit(0 if success else 1)
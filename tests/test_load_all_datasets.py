@@ -0,0 +1,176 @@
+# Indian Law RAG Chatbot - Extended Dataset Loader Tests
+"""
+Tests for the reference extraction in scripts/load_all_datasets.py.
+"""
+
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("datasets")
+pytest.importorskip("xxhash")
+
+
+# Inputs where re2 / Aho-Corasick and re could disagree: mixed case,
+# \v and \x1c whitespace, letter suffixes, non-ASCII case folding and digits
+TRICKY_TEXTS = [
+    "Under the INDIAN penal code, article 21 and section 302A apply",
+    "Article\t12section\t12C",
+    "section\x1c498A of the ipc",
+    "ARTICLE\x0b21",
+    "See Article 14 and Section 3",
+    "Conſumer Protection Act, ſection 2",
+    "İPC section ٣",
+    "the crpc and the IT Act",
+    "no references here",
+    "Under Section 154 of the CrPC read with IPC 302",
+    "Constitution of Indian Penal Code",
+]
+
+
+@pytest.mark.parametrize("text, act_name", [
+    ("Under Section 154 of the CrPC read with IPC 302", "Indian Penal Code"),
+    ("Consumer Protection Act and Constitution of India", "Constitution of India"),
+    ("Motor Vehicles Act; Indian Evidence Act", "Indian Evidence Act"),
+    ("Constitution of Indian Penal Code", "Indian Penal Code"),
+])
+def test_act_name_follows_priority_not_position(monkeypatch, text, act_name):
+    """The earliest act in priority order wins, on every scan path."""
+    import load_all_datasets
+    
+    load_all_datasets._find_act_name.cache_clear()
+    assert load_all_datasets._find_act_name(text) == act_name
+    for name in ("_ACT_AUTOMATON", "_ACT_UNION_RE2"):
+        monkeypatch.setattr(load_all_datasets, name, None)
+        load_all_datasets._find_act_name.cache_clear()
+        assert load_all_datasets._find_act_name(text) == act_name
+    load_all_datasets._find_act_name.cache_clear()
+
+
+def test_imports_and_extracts_with_re2():
+    """The optional re2 accelerator must not break importing the loader."""
+    pytest.importorskip("re2")
+    import load_all_datasets
+    
+    assert load_all_datasets._SEC_ART_RE2 is not None
+    
+    refs = load_all_datasets.extract_legal_references(TRICKY_TEXTS[0])
+    assert refs["act_name"] == "Indian Penal Code"
+    assert refs["section"] == "Section 302A"
+    assert load_all_datasets._ACT_UNION_RE2.search("what the crpc says").lastgroup == "crpc"
+
+
+@pytest.mark.parametrize("text", TRICKY_TEXTS)
+def test_accelerated_scans_match_re(monkeypatch, text):
+    """re2 / Aho-Corasick results must equal the plain re results."""
+    import load_all_datasets
+    
+    load_all_datasets._find_act_name.cache_clear()
+    load_all_datasets._find_section.cache_clear()
+    accelerated = load_all_datasets.extract_legal_references(text)
+    
+    for name in ("_ACT_AUTOMATON", "_ACT_UNION_RE2", "_SEC_ART_RE2", "_SECTION_RE2"):
+        monkeypatch.setattr(load_all_datasets, name, None)
+    load_all_datasets._find_act_name.cache_clear()
+    load_all_datasets._find_section.cache_clear()
+    plain = load_all_datasets.extract_legal_references(text)
+    load_all_datasets._find_act_name.cache_clear()
+    load_all_datasets._find_section.cache_clear()
+    
+    assert accelerated == plain
+
+
+def _fake_loaders(monkeypatch, fail_source=None, rows=10):
+    """Replace the Hub access with small in-memory streams."""
+    import load_all_datasets
+    from langchain_core.documents import Document
+    
+    monkeypatch.setattr(load_all_datasets, "load_dataset", lambda *args, **kwargs: {"train": None})
+    
+    def fake_iter_documents(data, process_batch, source, executor=None):
+        for i in range(rows):
+            if source == fail_source and i == 5:
+                raise ConnectionError("stream dropped")
+            yield Document(page_content=f"{source} row {i}", metadata={"source": source})
+    
+    monkeypatch.setattr(load_all_datasets, "_iter_documents", fake_iter_documents)
+    monkeypatch.setattr(load_all_datasets, "_corpus_fingerprint", lambda: "fingerprint")
+    return load_all_datasets
+
+
+def test_truncated_dataset_is_not_cached(monkeypatch, tmp_path):
+    load_all_datasets = _fake_loaders(monkeypatch, fail_source="harshitv804/Indian_Penal_Code")
+    monkeypatch.setattr(load_all_datasets.settings, "dataset_cache_dir", str(tmp_path))
+    
+    documents = list(load_all_datasets.load_all_datasets())
+    
+    ipc = [doc for doc in documents if doc.metadata["source"] == "harshitv804/Indian_Penal_Code"]
+    assert len(ipc) == 5
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_complete_corpus_is_cached_and_reused(monkeypatch, tmp_path):
+    load_all_datasets = _fake_loaders(monkeypatch)
+    monkeypatch.setattr(load_all_datasets.settings, "dataset_cache_dir", str(tmp_path))
+    
+    first = list(load_all_datasets.load_all_datasets())
+    assert (tmp_path / "docs_fingerprint.pkl").exists()
+    
+    monkeypatch.setattr(load_all_datasets, "_iter_documents", None)
+    second = list(load_all_datasets.load_all_datasets())
+    assert [doc.page_content for doc in second] == [doc.page_content for doc in first]
+
+
+def test_closing_early_stops_prefetch_threads(monkeypatch, tmp_path):
+    # More rows than a prefetch buffer holds, so the producers block
+    load_all_datasets = _fake_loaders(monkeypatch, rows=30_000)
+    monkeypatch.setattr(load_all_datasets.settings, "dataset_cache_dir", str(tmp_path))
+    monkeypatch.setattr(load_all_datasets, "PREFETCH_POLL", 0.01)
+    threads_before = threading.active_count()
+    
+    documents = load_all_datasets.load_all_datasets()
+    next(documents)
+    documents.close()
+    
+    deadline = time.monotonic() + 5
+    while threading.active_count() > threads_before and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert threading.active_count() == threads_before
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_rows_are_processed_in_worker_processes(monkeypatch):
+    """The pooled path yields the processor's documents, in row order."""
+    from datasets import Dataset
+    import load_all_datasets
+    
+    monkeypatch.setattr(load_all_datasets, "ROW_BATCH_SIZE", 4)
+    monkeypatch.setattr(load_all_datasets, "MAX_IN_FLIGHT", 2)
+    rows = {
+        "Instruction": [f"Question {i}" for i in range(23)],
+        "Response": [
+            "too short" if i % 5 == 0 else f"Under Section {i} of the IPC, the accused shall be punished"
+            for i in range(23)
+        ],
+    }
+    data = Dataset.from_dict(rows).to_iterable_dataset()
+    
+    expected = load_all_datasets._process_viber1_batch(rows, list(range(23)))
+    documents = list(load_all_datasets._iter_documents(
+        data, load_all_datasets._process_viber1_batch, "viber1"
+    ))
+    
+    assert [doc.page_content for doc in documents] == [c for c in expected["content"] if c]
+    assert [doc.metadata["index"] for doc in documents] == [i for i in range(23) if i % 5]
+    assert documents[0].metadata["section"] == "Section 1"
+
+
+def test_static_documents_are_fresh_per_call():
+    """Mutating returned core documents must not leak into later calls."""
+    import load_all_datasets
+    
+    for get_documents in (load_all_datasets.get_ipc_core_sections, load_all_datasets.get_constitution_articles):
+        documents = get_documents()
+        documents[0].metadata["x"] = 1
+        assert "x" not in get_documents()[0].metadata
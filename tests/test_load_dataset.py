@@ -0,0 +1,73 @@
+# Indian Law RAG Chatbot - Dataset Loader Tests
+"""
+Tests for the reference extraction in scripts/load_dataset.py.
+
+The optional Numba and Hyperscan scanners must give the same results
+as the regex fallback.
+"""
+
+import pytest
+
+pytest.importorskip("datasets")
+
+import load_dataset
+
+
+# Mixed case, \x1c / \v whitespace, letter suffixes (including one that
+# starts a following "Section"), overlapping act names and non-ASCII text
+TRICKY_TEXTS = [
+    "Section 302 of the Indian Penal Code",
+    "SECTION 420a read with sEcTiOn 120B",
+    "Article\t12section\t12C",
+    "section\x1c498A",
+    "ARTICLE\x0b21 and article 14",
+    "Article 5 only",
+    "Sectionx 5, Section5, Section 5",
+    "the CrPC, the IPC and the RTI",
+    "RTIPC",
+    "Constitution of Indian Penal Code",
+    "IT Act and Information Technology Act",
+    "code of civil procedure, CPC",
+    "ſection 5 of the Conſumer Protection Act",
+    "İPC section ٣",
+    "धारा 302 Section 302 IPC",
+    "",
+]
+
+
+def _regex_results(monkeypatch, text):
+    """Results with both accelerators disabled."""
+    monkeypatch.setattr(load_dataset, "_scan_reference", None)
+    monkeypatch.setattr(load_dataset, "_ACT_HS_DB", None)
+    return load_dataset._find_reference(text), load_dataset._find_act_name(text)
+
+
+@pytest.mark.parametrize("text", TRICKY_TEXTS)
+def test_numba_reference_scan_matches_regex(monkeypatch, text):
+    if load_dataset._scan_reference is None:
+        pytest.skip("numba not installed")
+    accelerated = load_dataset._find_reference(text)
+    assert accelerated == _regex_results(monkeypatch, text)[0]
+
+
+@pytest.mark.parametrize("text", TRICKY_TEXTS)
+def test_hyperscan_act_scan_matches_regex(monkeypatch, text):
+    if load_dataset._ACT_HS_DB is None:
+        pytest.skip("hyperscan not installed")
+    accelerated = load_dataset._find_act_name(text)
+    assert accelerated == _regex_results(monkeypatch, text)[1]
+
+
+def test_section_preferred_over_earlier_article():
+    refs = load_dataset.extract_legal_references("Article\t12section\t12C of the IPC")
+    assert refs["section"] == "Section 12C"
+    assert refs["act_name"] == "IPC"
+
+
+@pytest.mark.parametrize("text, act_name", [
+    ("RTIPC", "IPC"),
+    ("Constitution of Indian Penal Code", "Indian Penal Code"),
+])
+def test_act_overlapping_an_earlier_match_is_found(monkeypatch, text, act_name):
+    assert load_dataset._find_act_name(text) == act_name
+    assert _regex_results(monkeypatch, text)[1] == act_name